@@ -1,10 +1,19 @@
 """Email backend for ProtonMail Bridge."""
 
+import asyncio
+import functools
+import operator
 import os
+import re
+from contextlib import asynccontextmanager
+from datetime import datetime
 from email.header import decode_header
 from email import message_from_bytes
+from email.message import EmailMessage
+from email.parser import BytesHeaderParser
 from email.utils import parsedate_to_datetime
 
+import aiosmtplib
 import html2text
 from fastmcp import FastMCP
 from aioimaplib import IMAP4
@@ -19,13 +28,25 @@ IMAP_HOST = os.environ.get('PROTON_BRIDGE_HOST', '127.0.0.1')
 IMAP_PORT = int(os.environ.get('PROTON_BRIDGE_IMAP_PORT', '1143'))
 IMAP_USER = os.environ.get('PROTON_BRIDGE_USER', '')
 IMAP_PASS = os.environ.get('PROTON_BRIDGE_PASSWORD', '')
+# Upper bound on concurrent IMAP connections per account (bridges/servers
+# cap per-account sessions)
+IMAP_MAX_CONNS = int(os.environ.get('PROTON_BRIDGE_MAX_CONNS', '4'))
+# SMTP shares the bridge host/user/password with IMAP; only the port differs
+SMTP_PORT = int(os.environ.get('PROTON_BRIDGE_SMTP_PORT', '1025'))
 
 mcp = FastMCP('email')
 
 
+# Senders and subjects repeat across pages of the same mailbox, so memoize
+# alongside the date caches below
+@functools.lru_cache(maxsize=4096)
 def decode_mime_header(header):
     if not header:
         return ''
+    # RFC 2047 encoded words always contain '=?'; plain headers (the vast
+    # majority) skip decode_header's state machine entirely
+    if '=?' not in header:
+        return header
     parts = decode_header(header)
     decoded = []
     for content, charset in parts:
@@ -36,16 +57,26 @@ def decode_mime_header(header):
     return ''.join(decoded)
 
 
+# Date headers repeat across list/sort/format calls, so memoize the parse —
+# parsedate_to_datetime is the CPU hot spot when sorting a listing
+@functools.lru_cache(maxsize=4096)
 def parse_email_date(date_str):
     """Parse email date string to datetime for sorting."""
     if not date_str:
         return None
+    # Nearly all Date headers use the canonical RFC 2822 shape; strptime is
+    # much cheaper than parsedate_to_datetime's general-purpose machinery
+    try:
+        return datetime.strptime(date_str, '%a, %d %b %Y %H:%M:%S %z')
+    except ValueError:
+        pass
     try:
         return parsedate_to_datetime(date_str)
     except Exception:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def format_local_time(date_str):
     """Convert email date to local time string."""
     parsed = parse_email_date(date_str)
@@ -56,66 +87,259 @@ def format_local_time(date_str):
     return local_dt.strftime('%Y-%m-%d %H:%M')
 
 
-def sort_emails_by_date(emails, newest_first=True):
-    """Sort emails by date, newest first by default."""
-    return sorted(
-        emails,
-        key=lambda e: parse_email_date(e.get('date')) or parsedate_to_datetime('1 Jan 1970 00:00:00 +0000'),
-        reverse=newest_first
-    )
+_EPOCH = parsedate_to_datetime('1 Jan 1970 00:00:00 +0000')
 
 
-async def get_imap_client():
-    """Create and authenticate IMAP client."""
+def sort_emails_by_date(emails, newest_first=True):
+    """Sort emails by date, newest first by default."""
+    # Decorate-sort-undecorate: compute each key once up front so the sort
+    # compares plain datetimes via itemgetter instead of invoking a Python
+    # key lambda per comparison
+    decorated = [(parse_email_date(e.get('date')) or _EPOCH, e) for e in emails]
+    decorated.sort(key=operator.itemgetter(0), reverse=newest_first)
+    return [e for _, e in decorated]
+
+
+# Logged-in IMAP sessions reused across tool calls, keyed by
+# (host, user, slot) — slot 0 serves normal calls, higher slots are extra
+# connections for sharded fetches. The TLS+LOGIN handshake dominates wall
+# time for the typical burst of list/get calls, so keep sessions open
+# instead of logging out each time.
+_imap_pool: dict[tuple[str, str, int], IMAP4] = {}
+# One lock per pooled connection, held for a tool call's entire use of it.
+# IMAP sessions are stateful (SELECT, then SEARCH/FETCH against the selected
+# mailbox), so interleaving commands from concurrent tool calls on one
+# connection would corrupt both callers' results.
+_imap_locks: dict[tuple[str, str, int], asyncio.Lock] = {}
+
+
+async def _connect_imap() -> IMAP4:
+    """Create and authenticate a fresh IMAP client."""
     client = IMAP4(host=IMAP_HOST, port=IMAP_PORT, timeout=30)
     await client.wait_hello_from_server()
     await client.login(IMAP_USER, IMAP_PASS)
     return client
 
 
+@asynccontextmanager
+async def imap_session(mailbox: str = 'INBOX', slot: int = 0):
+    """Check out the pooled IMAP connection for `slot`, `mailbox` selected.
+
+    The slot's lock is held until the block exits, so a concurrent tool
+    call can't slip a SELECT between this caller's SEARCH and FETCH. A
+    NOOP probes cached sessions for dropped connections (the bridge drops
+    idle sessions after a while); dead entries are rebuilt. SELECT is only
+    reissued when the requested mailbox changes.
+    """
+    key = (IMAP_HOST, IMAP_USER, slot)
+    lock = _imap_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        client = _imap_pool.get(key)
+        if client is not None:
+            try:
+                await client.noop()
+            except Exception:
+                _imap_pool.pop(key, None)
+                client = None
+        if client is None:
+            client = await _connect_imap()
+            _imap_pool[key] = client
+        if getattr(client, '_selected_mailbox', None) != mailbox:
+            result = await client.select(mailbox)
+            if result.result != 'OK':
+                # A failed SELECT leaves the connection with no mailbox
+                # selected (RFC 3501), so cache nothing — otherwise later
+                # commands would silently run against the old mailbox, and
+                # retries of the bad name would skip the SELECT entirely
+                client._selected_mailbox = None
+                raise ValueError(f'Cannot select mailbox: {mailbox}')
+            client._selected_mailbox = mailbox
+        yield client
+
+
+# Message-set FETCHes are chunked so one huge request can't trip server
+# command-size limits
+_FETCH_BATCH_SIZE = 100
+
+# Matches the untagged FETCH metadata line and captures the sequence number
+_FETCH_SEQ_RE = re.compile(rb'^\*?\s*(\d+)\s+FETCH', re.IGNORECASE)
+
+_HEADER_FIELDS = '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])'
+
+# Header-only parser skips MIME body tokenization — the list path never
+# reads past From/Subject/Date
+_HDR_PARSER = BytesHeaderParser()
+
+# get_email truncates bodies to 5000 chars; decoding more than this many
+# bytes of a plain-text payload is wasted work (generous margin for
+# multibyte characters)
+_MAX_BODY_DECODE = 20000
+
+
+# Shard header fetches across extra connections once a listing spans more
+# than this many messages
+_CONCURRENT_FETCH_THRESHOLD = 32
+
+
+def _parse_header_lines(lines) -> list[dict]:
+    """Parse interleaved FETCH response lines into email summary dicts.
+
+    The response interleaves '<seq> FETCH (...' metadata lines with
+    header byte literals, so walk the lines pairing each sequence number
+    with the blob that follows it.
+    """
+    emails = []
+    current_id = None
+    for line in lines:
+        # No bytes(line) copy — the regex and parser both accept bytearray
+        raw = line if isinstance(line, (bytes, bytearray)) else None
+        if not raw:
+            continue
+        seq = _FETCH_SEQ_RE.match(raw)
+        if seq:
+            current_id = seq.group(1).decode()
+            continue
+        if current_id and len(raw) > 20:
+            # Header blobs must contain 'Name: value' lines — cheap
+            # structural check saves a parser invocation on stray framing
+            if raw.find(b':') <= 0 or b'\n' not in raw:
+                continue
+            try:
+                msg = _HDR_PARSER.parsebytes(raw)
+            except Exception:
+                continue
+            if msg.get('From') or msg.get('Subject'):
+                date_raw = msg.get('Date', '')
+                emails.append({
+                    'id': current_id,
+                    'from': decode_mime_header(msg.get('From', '')),
+                    'subject': decode_mime_header(msg.get('Subject', '')),
+                    'date': date_raw,
+                    'local_time': format_local_time(date_raw),
+                })
+                current_id = None
+    return emails
+
+
+def _optimize_sequence(msg_ids: list[str]) -> str:
+    """Compress consecutive IDs into IMAP ranges ('1,2,3,7' -> '1:3,7')."""
+    parts = []
+    start = prev = int(msg_ids[0])
+    for mid in msg_ids[1:]:
+        n = int(mid)
+        if n == prev + 1:
+            prev = n
+            continue
+        parts.append(str(start) if start == prev else f'{start}:{prev}')
+        start = prev = n
+    parts.append(str(start) if start == prev else f'{start}:{prev}')
+    return ','.join(parts)
+
+
+async def _fetch_shard(client, msg_ids: list[str]) -> list[dict]:
+    """Fetch headers for msg_ids on one connection, one FETCH per batch.
+
+    A single message-set FETCH (e.g. '1:3,7') replaces N sequential
+    round-trips.
+    """
+    emails = []
+    for start in range(0, len(msg_ids), _FETCH_BATCH_SIZE):
+        batch = msg_ids[start:start + _FETCH_BATCH_SIZE]
+        result = await client.fetch(_optimize_sequence(batch), _HEADER_FIELDS)
+        if result.result == 'OK':
+            emails.extend(_parse_header_lines(result.lines))
+    return emails
+
+
+async def _fetch_headers(client, msg_ids: list[str], mailbox: str = 'INBOX') -> list[dict]:
+    """Fetch From/Subject/Date for all msg_ids, sharding large sets.
+
+    Big listings split across up to IMAP_MAX_CONNS pooled connections so
+    shards proceed in parallel; callers re-sort by date afterwards, so
+    merge order doesn't matter.
+    """
+    shards = min(IMAP_MAX_CONNS, -(-len(msg_ids) // _CONCURRENT_FETCH_THRESHOLD))
+    if shards <= 1:
+        return await _fetch_shard(client, msg_ids)
+
+    async def _shard_on_slot(slot, ids):
+        # Checkout holds the slot's lock for the duration of the fetch;
+        # callers hold slot 0 and acquire upwards, so ordering is consistent
+        async with imap_session(mailbox, slot=slot) as c:
+            return await _fetch_shard(c, ids)
+
+    step = -(-len(msg_ids) // shards)
+    results = await asyncio.gather(
+        _fetch_shard(client, msg_ids[:step]),
+        *(
+            _shard_on_slot(i, msg_ids[i * step:(i + 1) * step])
+            for i in range(1, shards)
+        ),
+    )
+    return [e for shard in results for e in shard]
+
+
 @mcp.tool()
 async def list_emails(mailbox: str = 'INBOX', limit: int = 10) -> list[dict]:
     """List recent emails with subject, sender, and date (newest first)."""
-    client = await get_imap_client()
-    await client.select(mailbox)
-
-    result = await client.search('ALL')
-    if result.result != 'OK':
-        await client.logout()
+    try:
+        async with imap_session(mailbox) as client:
+            result = await client.search('ALL')
+            if result.result != 'OK':
+                return []
+
+            msg_ids = result.lines[0].decode().split()
+            # Fetch more than limit since we'll sort by date
+            fetch_count = min(len(msg_ids), limit * 2)
+            msg_ids = msg_ids[-fetch_count:]
+
+            emails = await _fetch_headers(client, msg_ids, mailbox)
+    except ValueError:
         return []
 
-    msg_ids = result.lines[0].decode().split()
-    # Fetch more than limit since we'll sort by date
-    fetch_count = min(len(msg_ids), limit * 2)
-    msg_ids = msg_ids[-fetch_count:]
-
-    emails = []
-    for msg_id in msg_ids:
-        result = await client.fetch(msg_id, '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])')
-        if result.result == 'OK':
-            for line in result.lines:
-                raw = bytes(line) if isinstance(line, (bytes, bytearray)) else None
-                if raw and len(raw) > 20:
-                    try:
-                        msg = message_from_bytes(raw)
-                        if msg.get('From') or msg.get('Subject'):
-                            date_raw = msg.get('Date', '')
-                            emails.append({
-                                'id': msg_id,
-                                'from': decode_mime_header(msg.get('From', '')),
-                                'subject': decode_mime_header(msg.get('Subject', '')),
-                                'date': date_raw,
-                                'local_time': format_local_time(date_raw),
-                            })
-                            break
-                    except:
-                        pass
-
-    await client.logout()
     # Sort by date (newest first) and limit results
     return sort_emails_by_date(emails)[:limit]
 
 
+async def _search_mailbox(
+    mailbox: str,
+    query: str,
+    limit: int,
+    search_body: bool,
+    slot: int = 0,
+    shard: bool = True,
+) -> list[dict]:
+    """Search one mailbox and fetch headers for the matches."""
+    try:
+        async with imap_session(mailbox, slot=slot) as client:
+            # Build IMAP search criteria
+            # Search in FROM, SUBJECT, and optionally BODY
+            search_criteria = f'OR FROM "{query}" SUBJECT "{query}"'
+            if search_body:
+                search_criteria = f'OR ({search_criteria}) BODY "{query}"'
+
+            result = await client.search(search_criteria)
+            if result.result != 'OK':
+                return []
+
+            msg_ids = result.lines[0].decode().split()
+            if not msg_ids:
+                return []
+
+            # Fetch more than limit since we'll sort by date
+            fetch_count = min(len(msg_ids), limit * 2)
+            msg_ids = msg_ids[-fetch_count:]
+
+            if shard:
+                return await _fetch_headers(client, msg_ids, mailbox)
+            # Parallel mailboxes already occupy one connection each — don't
+            # shard, or concurrent searches would interleave commands on the
+            # slots their siblings are using
+            return await _fetch_shard(client, msg_ids)
+    except ValueError:
+        return []
+
+
 @mcp.tool()
 async def search_emails(
     query: str,
@@ -127,59 +351,34 @@ async def search_emails(
 
     Args:
         query: Search term to find in emails
-        mailbox: Mailbox to search (default: INBOX)
+        mailbox: Mailbox to search; comma-separated to search several in
+            parallel, e.g. "INBOX,Archive" (default: INBOX)
         limit: Maximum results to return (default: 20)
         search_body: Also search email body content (slower)
 
     Returns:
         List of matching emails with id, from, subject, date
     """
-    client = await get_imap_client()
-    await client.select(mailbox)
-
-    # Build IMAP search criteria
-    # Search in FROM, SUBJECT, and optionally BODY
-    search_criteria = f'OR FROM "{query}" SUBJECT "{query}"'
-    if search_body:
-        search_criteria = f'OR ({search_criteria}) BODY "{query}"'
-
-    result = await client.search(search_criteria)
-    if result.result != 'OK':
-        await client.logout()
-        return []
-
-    msg_ids = result.lines[0].decode().split()
-    if not msg_ids:
-        await client.logout()
-        return []
+    boxes = [m.strip() for m in mailbox.split(',') if m.strip()] or ['INBOX']
 
-    # Fetch more than limit since we'll sort by date
-    fetch_count = min(len(msg_ids), limit * 2)
-    msg_ids = msg_ids[-fetch_count:]
+    if len(boxes) == 1:
+        emails = await _search_mailbox(boxes[0], query, limit, search_body)
+    else:
+        # Each mailbox searches on its own pooled connection, so total
+        # latency is the slowest folder instead of the sum of all of them.
+        # Sharded fetches are disabled here — every slot is already in use
+        # by a sibling search. Mailboxes beyond the connection cap run in
+        # follow-up waves rather than being dropped.
+        emails = []
+        for start in range(0, len(boxes), IMAP_MAX_CONNS):
+            wave = boxes[start:start + IMAP_MAX_CONNS]
+            results = await asyncio.gather(*(
+                _search_mailbox(m, query, limit, search_body,
+                                slot=i, shard=False)
+                for i, m in enumerate(wave)
+            ))
+            emails.extend(e for matches in results for e in matches)
 
-    emails = []
-    for msg_id in msg_ids:
-        result = await client.fetch(msg_id, '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)])')
-        if result.result == 'OK':
-            for line in result.lines:
-                raw = bytes(line) if isinstance(line, (bytes, bytearray)) else None
-                if raw and len(raw) > 20:
-                    try:
-                        msg = message_from_bytes(raw)
-                        if msg.get('From') or msg.get('Subject'):
-                            date_raw = msg.get('Date', '')
-                            emails.append({
-                                'id': msg_id,
-                                'from': decode_mime_header(msg.get('From', '')),
-                                'subject': decode_mime_header(msg.get('Subject', '')),
-                                'date': date_raw,
-                                'local_time': format_local_time(date_raw),
-                            })
-                            break
-                    except:
-                        pass
-
-    await client.logout()
     # Sort by date (newest first) and limit results
     return sort_emails_by_date(emails)[:limit]
 
@@ -187,54 +386,63 @@ async def search_emails(
 @mcp.tool()
 async def get_email(message_id: str, mailbox: str = 'INBOX') -> dict:
     """Get full email content by message ID."""
-    client = await get_imap_client()
-    await client.select(mailbox)
-
-    result = await client.fetch(message_id, '(RFC822)')
+    try:
+        async with imap_session(mailbox) as client:
+            result = await client.fetch(message_id, '(RFC822)')
+    except ValueError:
+        return {'error': f'Cannot select mailbox: {mailbox}'}
     if result.result != 'OK':
-        await client.logout()
         return {'error': 'Message not found'}
 
     raw_email = None
     for line in result.lines:
         if isinstance(line, (bytes, bytearray)) and len(line) > 500:
-            raw_email = bytes(line)
+            # Pass the buffer through as-is; copying a multi-MB body into a
+            # fresh bytes object just to parse it doubles peak memory
+            raw_email = line
             break
 
     if not raw_email:
-        await client.logout()
         return {'error': 'Could not find message body'}
 
     try:
         msg = message_from_bytes(raw_email)
     except Exception as e:
-        await client.logout()
         return {'error': f'Parse error: {e}'}
 
     body = ''
     plain_body = ''
     if msg.is_multipart():
-        for part in msg.walk():
+        # Breadth-first over the part tree instead of walk(): only multipart
+        # containers are descended into, so attachment subtrees are pruned,
+        # and traversal stops at the first text/html part
+        queue = list(msg.get_payload())
+        while queue:
+            part = queue.pop(0)
             ct = part.get_content_type()
             if ct == 'text/html':
                 payload = part.get_payload(decode=True)
                 if payload:
                     body = _html_converter.handle(payload.decode('utf-8', errors='replace')).strip()
                     break
+            elif ct.startswith('multipart/'):
+                queue.extend(part.get_payload())
             elif ct == 'text/plain' and not plain_body:
                 payload = part.get_payload(decode=True)
                 if payload:
-                    plain_body = payload.decode('utf-8', errors='replace')
+                    # Response is capped at 5000 chars, so don't decode a
+                    # multi-MB body past what can be returned
+                    plain_body = payload[:_MAX_BODY_DECODE].decode('utf-8', errors='replace')
         if not body:
             body = plain_body
     else:
         payload = msg.get_payload(decode=True)
         if payload:
-            body = payload.decode('utf-8', errors='replace')
             if msg.get_content_type() == 'text/html':
-                body = _html_converter.handle(body).strip()
+                body = _html_converter.handle(payload.decode('utf-8', errors='replace')).strip()
+            else:
+                body = payload[:_MAX_BODY_DECODE].decode('utf-8', errors='replace')
 
-    await client.logout()
     date_raw = msg.get('Date', '')
     return {
         'id': message_id,
@@ -247,31 +455,47 @@ async def get_email(message_id: str, mailbox: str = 'INBOX') -> dict:
     }
 
 
+# Persistent SMTP session, reused across sends — aiosmtplib.send() opens a
+# fresh connection and STARTTLS handshake per message otherwise
+_smtp: aiosmtplib.SMTP | None = None
+_smtp_lock = asyncio.Lock()
+
+
+async def _get_smtp() -> aiosmtplib.SMTP:
+    """Return a connected, authenticated SMTP session (caller holds lock)."""
+    global _smtp
+    if _smtp is None:
+        smtp = aiosmtplib.SMTP(
+            hostname=IMAP_HOST,
+            port=SMTP_PORT,
+            start_tls=True,
+            validate_certs=False,
+        )
+        await smtp.connect()
+        await smtp.login(IMAP_USER, IMAP_PASS)
+        _smtp = smtp
+    return _smtp
+
+
 @mcp.tool()
 async def send_email(to: str, subject: str, body: str) -> dict:
     """Send an email via SMTP."""
-    import aiosmtplib
-    from email.message import EmailMessage
-
-    smtp_host = os.environ.get('PROTON_BRIDGE_HOST', '127.0.0.1')
-    smtp_port = int(os.environ.get('PROTON_BRIDGE_SMTP_PORT', '1025'))
-    smtp_user = os.environ.get('PROTON_BRIDGE_USER', '')
-    smtp_pass = os.environ.get('PROTON_BRIDGE_PASSWORD', '')
+    global _smtp
 
     msg = EmailMessage()
-    msg['From'] = smtp_user
+    msg['From'] = IMAP_USER
     msg['To'] = to
     msg['Subject'] = subject
     msg.set_content(body)
 
-    await aiosmtplib.send(
-        msg,
-        hostname=smtp_host,
-        port=smtp_port,
-        username=smtp_user,
-        password=smtp_pass,
-        start_tls=True,
-        validate_certs=False,
-    )
+    async with _smtp_lock:
+        try:
+            smtp = await _get_smtp()
+            await smtp.send_message(msg)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Server dropped the idle session — reconnect once and retry
+            _smtp = None
+            smtp = await _get_smtp()
+            await smtp.send_message(msg)
 
     return {'status': 'sent', 'to': to, 'subject': subject}
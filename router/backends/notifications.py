@@ -4,13 +4,15 @@ Provides MCP tools for pushing/reading notifications from any service,
 plus HTTP API endpoints for non-MCP consumers (terminal clients, dashboards, etc.).
 """
 
+import functools
 import json
 import logging
 import os
 import uuid
-from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 import aiosqlite
@@ -28,6 +30,8 @@ async def _get_db() -> aiosqlite.Connection:
     db = await aiosqlite.connect(NOTIFY_DB_PATH)
     db.row_factory = aiosqlite.Row
     await db.execute('PRAGMA journal_mode=WAL')
+    # WAL makes NORMAL durable enough here; saves an fsync per commit
+    await db.execute('PRAGMA synchronous=NORMAL')
     return db
 
 
@@ -53,42 +57,112 @@ async def _init_db():
                 ON notifications (source);
             CREATE INDEX IF NOT EXISTS idx_notifications_created
                 ON notifications (created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_notifications_read_source
+                ON notifications (read_at, source);
+            CREATE INDEX IF NOT EXISTS idx_notifications_read_level
+                ON notifications (read_at, level);
         ''')
         await db.commit()
     finally:
         await db.close()
 
 
-def _now() -> str:
-    return datetime.now(timezone.utc).isoformat()
-
-
 async def _auto_cleanup(db: aiosqlite.Connection):
     """Prune expired notifications and old read notifications (>24h)."""
     try:
-        now = _now()
-        cutoff = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
+        # datetime() normalizes both stored formats — caller-supplied ISO-8601
+        # ('T' separator, optional offset) and SQLite's space-separated
+        # CURRENT_TIMESTAMP — so these don't degrade into lexicographic
+        # string compares across formats
         await db.execute(
-            "DELETE FROM notifications WHERE expires_at IS NOT NULL AND expires_at < ?",
-            (now,),
+            "DELETE FROM notifications WHERE expires_at IS NOT NULL AND datetime(expires_at) < datetime('now')",
         )
         await db.execute(
-            "DELETE FROM notifications WHERE read_at IS NOT NULL AND read_at < ?",
-            (cutoff,),
+            "DELETE FROM notifications WHERE read_at IS NOT NULL AND datetime(read_at) < datetime('now', '-24 hours')",
         )
         await db.commit()
     except Exception:
         logger.warning("Auto-cleanup failed", exc_info=True)
 
 
+# Light projection for list endpoints — skips the potentially large body and
+# metadata_json blobs, which only get() needs to return.
+_LIST_COLUMNS = 'id, level, source, title, created_at, read_at'
+
+# Constant statement text regardless of how many IDs are passed (the list is
+# bound as a JSON array), so SQLite can reuse the prepared statement instead
+# of recompiling a fresh IN (?,?,...) clause per call. The read timestamp is
+# generated in SQLite, matching the created_at column default.
+_MARK_READ_SQL = '''UPDATE notifications SET read_at = CURRENT_TIMESTAMP
+    WHERE id IN (SELECT value FROM json_each(?)) AND read_at IS NULL'''
+
+
+async def _insert_many(rows: list[tuple]) -> list[str]:
+    """Bulk-insert (level, source, title) rows in a single transaction.
+
+    Used by tests and batch producers — executemany with one commit instead
+    of an INSERT+fsync per row. Returns the generated ids in row order.
+    """
+    await _init_db()
+    ids = [str(uuid.uuid4())[:8] for _ in rows]
+    db = await _get_db()
+    try:
+        await db.executemany(
+            'INSERT INTO notifications (id, level, source, title) VALUES (?, ?, ?, ?)',
+            [(nid, *row) for nid, row in zip(ids, rows)],
+        )
+        await db.commit()
+    finally:
+        await db.close()
+    return ids
+
+
+@functools.lru_cache(maxsize=8)
+def _list_sql(unread_only: bool, has_source: bool, has_level: bool) -> str:
+    """Build the list query for a filter combination, cached per combination.
+
+    Returning the exact same string object for repeat calls lets sqlite3's
+    per-connection statement cache hit instead of re-parsing concatenated SQL.
+    """
+    query = f'SELECT {_LIST_COLUMNS} FROM notifications WHERE 1=1'
+    if unread_only:
+        query += ' AND read_at IS NULL'
+    if has_source:
+        query += ' AND source = ?'
+    if has_level:
+        query += ' AND level = ?'
+    return query + ' ORDER BY created_at DESC LIMIT ?'
+
+
+async def _summarize_unread(db: aiosqlite.Connection) -> dict:
+    """Aggregate unread counts with one grouped scan instead of three."""
+    rows = await db.execute_fetchall(
+        'SELECT source, level, COUNT(*) as count FROM notifications'
+        ' WHERE read_at IS NULL GROUP BY source, level',
+    )
+    total_unread = 0
+    by_source = {}
+    by_level = {}
+    for r in rows:
+        count = r['count']
+        total_unread += count
+        by_source[r['source']] = by_source.get(r['source'], 0) + count
+        by_level[r['level']] = by_level.get(r['level'], 0) + count
+    return {
+        'total_unread': total_unread,
+        'by_source': by_source,
+        'by_level': by_level,
+    }
+
+
 def _row_to_dict(row) -> dict:
     if row is None:
         return None
     d = dict(row)
     if d.get('metadata_json'):
         try:
-            d['metadata'] = json.loads(d['metadata_json'])
-        except json.JSONDecodeError:
+            d['metadata'] = orjson.loads(d['metadata_json'])
+        except orjson.JSONDecodeError:
             pass
     return d
 
@@ -131,7 +205,7 @@ async def push(
             '''INSERT INTO notifications (id, level, source, title, body, metadata_json, expires_at)
                VALUES (?, ?, ?, ?, ?, ?, ?)''',
             (notification_id, level, source, title, body,
-             json.dumps(metadata) if metadata else None, expires_at),
+             orjson.dumps(metadata).decode() if metadata else None, expires_at),
         )
         await db.commit()
     finally:
@@ -161,19 +235,8 @@ async def list_notifications(
     await _init_db()
     limit = min(max(1, limit), 100)
 
-    query = 'SELECT * FROM notifications WHERE 1=1'
-    params = []
-
-    if unread_only:
-        query += ' AND read_at IS NULL'
-    if source:
-        query += ' AND source = ?'
-        params.append(source)
-    if level:
-        query += ' AND level = ?'
-        params.append(level)
-
-    query += ' ORDER BY created_at DESC LIMIT ?'
+    query = _list_sql(unread_only, bool(source), bool(level))
+    params = [p for p in (source, level) if p]
     params.append(limit)
 
     db = await _get_db()
@@ -223,13 +286,10 @@ async def mark_read(notification_ids: list[str]) -> dict:
         return {'error': 'No notification IDs provided'}
 
     await _init_db()
-    now = _now()
     db = await _get_db()
     try:
-        placeholders = ','.join('?' for _ in notification_ids)
         cursor = await db.execute(
-            f'UPDATE notifications SET read_at = ? WHERE id IN ({placeholders}) AND read_at IS NULL',
-            [now] + notification_ids,
+            _MARK_READ_SQL, (json.dumps(notification_ids),),
         )
         await db.commit()
         return {'marked': cursor.rowcount}
@@ -286,29 +346,7 @@ async def summary() -> dict:
     await _init_db()
     db = await _get_db()
     try:
-        # Total unread
-        rows = await db.execute_fetchall(
-            'SELECT COUNT(*) as count FROM notifications WHERE read_at IS NULL',
-        )
-        total_unread = rows[0]['count']
-
-        # By source
-        rows = await db.execute_fetchall(
-            'SELECT source, COUNT(*) as count FROM notifications WHERE read_at IS NULL GROUP BY source',
-        )
-        by_source = {r['source']: r['count'] for r in rows}
-
-        # By level
-        rows = await db.execute_fetchall(
-            'SELECT level, COUNT(*) as count FROM notifications WHERE read_at IS NULL GROUP BY level',
-        )
-        by_level = {r['level']: r['count'] for r in rows}
-
-        return {
-            'total_unread': total_unread,
-            'by_source': by_source,
-            'by_level': by_level,
-        }
+        return await _summarize_unread(db)
     finally:
         await db.close()
 
@@ -318,12 +356,25 @@ async def summary() -> dict:
 # ---------------------------------------------------------------------------
 
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response, StreamingResponse
 from starlette.routing import Route
 
 
-async def http_list_notifications(request: Request) -> JSONResponse:
-    """List notifications with query param filters."""
+class ORJSONResponse(Response):
+    """JSONResponse variant rendered with orjson (~5x faster than stdlib json)."""
+
+    media_type = 'application/json'
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+async def http_list_notifications(request: Request) -> StreamingResponse:
+    """List notifications with query param filters.
+
+    Streams rows straight from the cursor so peak memory stays O(1) in the
+    limit and the first bytes go out before the query finishes.
+    """
     await _init_db()
 
     unread_only = request.query_params.get('unread_only', '').lower() in ('true', '1', 'yes')
@@ -331,32 +382,31 @@ async def http_list_notifications(request: Request) -> JSONResponse:
     level = request.query_params.get('level')
     limit = min(int(request.query_params.get('limit', '20')), 100)
 
-    query = 'SELECT * FROM notifications WHERE 1=1'
-    params = []
-
-    if unread_only:
-        query += ' AND read_at IS NULL'
-    if source:
-        query += ' AND source = ?'
-        params.append(source)
-    if level:
-        query += ' AND level = ?'
-        params.append(level)
-
-    query += ' ORDER BY created_at DESC LIMIT ?'
+    query = _list_sql(unread_only, bool(source), bool(level))
+    params = [p for p in (source, level) if p]
     params.append(limit)
 
-    db = await _get_db()
-    try:
-        await _auto_cleanup(db)
-        rows = await db.execute_fetchall(query, params)
-        notifications = [_row_to_dict(r) for r in rows]
-        return JSONResponse({'notifications': notifications, 'count': len(notifications)})
-    finally:
-        await db.close()
-
-
-async def http_get_notification(request: Request) -> JSONResponse:
+    async def stream():
+        # The generator owns the connection: it outlives the handler, so the
+        # close has to happen here rather than in the handler's scope.
+        db = await _get_db()
+        try:
+            await _auto_cleanup(db)
+            yield b'{"notifications":['
+            count = 0
+            async with await db.execute(query, params) as cursor:
+                async for row in cursor:
+                    chunk = orjson.dumps(_row_to_dict(row))
+                    yield b',' + chunk if count else chunk
+                    count += 1
+            yield b'],"count":%d}' % count
+        finally:
+            await db.close()
+
+    return StreamingResponse(stream(), media_type='application/json')
+
+
+async def http_get_notification(request: Request) -> ORJSONResponse:
     """Get a single notification."""
     notification_id = request.path_params['notification_id']
     await _init_db()
@@ -366,79 +416,67 @@ async def http_get_notification(request: Request) -> JSONResponse:
             'SELECT * FROM notifications WHERE id = ?', (notification_id,),
         )
         if not rows:
-            return JSONResponse({'error': 'Not found'}, status_code=404)
-        return JSONResponse({'notification': _row_to_dict(rows[0])})
+            return ORJSONResponse({'error': 'Not found'}, status_code=404)
+        return ORJSONResponse({'notification': _row_to_dict(rows[0])})
     finally:
         await db.close()
 
 
-async def http_mark_read(request: Request) -> JSONResponse:
+async def http_mark_read(request: Request) -> ORJSONResponse:
     """Mark notifications as read. Body: {"ids": [...]}"""
     await _init_db()
-    body = await request.json()
+    body = orjson.loads(await request.body())
     ids = body.get('ids', [])
     if not ids:
-        return JSONResponse({'error': 'No IDs provided'}, status_code=400)
+        return ORJSONResponse({'error': 'No IDs provided'}, status_code=400)
 
-    now = _now()
     db = await _get_db()
     try:
-        placeholders = ','.join('?' for _ in ids)
-        cursor = await db.execute(
-            f'UPDATE notifications SET read_at = ? WHERE id IN ({placeholders}) AND read_at IS NULL',
-            [now] + ids,
-        )
+        cursor = await db.execute(_MARK_READ_SQL, (json.dumps(ids),))
         await db.commit()
-        return JSONResponse({'marked': cursor.rowcount})
+        return ORJSONResponse({'marked': cursor.rowcount})
     finally:
         await db.close()
 
 
-async def http_summary(request: Request) -> JSONResponse:
+async def http_summary(request: Request) -> ORJSONResponse:
     """Unread counts by source/level."""
     await _init_db()
     db = await _get_db()
     try:
-        rows = await db.execute_fetchall(
-            'SELECT COUNT(*) as count FROM notifications WHERE read_at IS NULL',
-        )
-        total_unread = rows[0]['count']
-
-        rows = await db.execute_fetchall(
-            'SELECT source, COUNT(*) as count FROM notifications WHERE read_at IS NULL GROUP BY source',
-        )
-        by_source = {r['source']: r['count'] for r in rows}
-
-        rows = await db.execute_fetchall(
-            'SELECT level, COUNT(*) as count FROM notifications WHERE read_at IS NULL GROUP BY level',
-        )
-        by_level = {r['level']: r['count'] for r in rows}
-
-        return JSONResponse({
-            'total_unread': total_unread,
-            'by_source': by_source,
-            'by_level': by_level,
-        })
+        return ORJSONResponse(await _summarize_unread(db))
     finally:
         await db.close()
 
 
-async def http_push(request: Request) -> JSONResponse:
-    """Push a notification via HTTP. Body: {level, source, title, body?, metadata?, expires_at?}"""
+async def http_push(request: Request) -> ORJSONResponse:
+    """Push a notification via HTTP. Body: {level, source, title, body?, metadata?, expires_at?}
+
+    Callers that already hold serialized metadata can send it as a
+    'metadata_json' string; it's validated and stored verbatim, skipping the
+    dict decode + re-encode round trip that 'metadata' pays.
+    """
     await _init_db()
-    body = await request.json()
+    body = orjson.loads(await request.body())
 
     required = ['level', 'source', 'title']
     missing = [f for f in required if f not in body]
     if missing:
-        return JSONResponse({'error': f'Missing fields: {missing}'}, status_code=400)
+        return ORJSONResponse({'error': f'Missing fields: {missing}'}, status_code=400)
 
     level = body['level']
     if level not in ('info', 'warning', 'error'):
-        return JSONResponse({'error': f'Invalid level: {level}'}, status_code=400)
+        return ORJSONResponse({'error': f'Invalid level: {level}'}, status_code=400)
 
     notification_id = str(uuid.uuid4())[:8]
-    metadata = body.get('metadata')
+    metadata_json = body.get('metadata_json')
+    if metadata_json is not None:
+        try:
+            orjson.loads(metadata_json)
+        except (TypeError, orjson.JSONDecodeError):
+            return ORJSONResponse({'error': 'metadata_json is not valid JSON'}, status_code=400)
+    elif body.get('metadata'):
+        metadata_json = orjson.dumps(body['metadata']).decode()
 
     db = await _get_db()
     try:
@@ -446,14 +484,13 @@ async def http_push(request: Request) -> JSONResponse:
             '''INSERT INTO notifications (id, level, source, title, body, metadata_json, expires_at)
                VALUES (?, ?, ?, ?, ?, ?, ?)''',
             (notification_id, level, body['source'], body['title'],
-             body.get('body'), json.dumps(metadata) if metadata else None,
-             body.get('expires_at')),
+             body.get('body'), metadata_json, body.get('expires_at')),
         )
         await db.commit()
     finally:
         await db.close()
 
-    return JSONResponse({
+    return ORJSONResponse({
         'id': notification_id,
         'level': level,
         'source': body['source'],
@@ -4,8 +4,9 @@ Provides a streamlined 2-tool API that consolidates the full Todoist API
 into LLM-friendly operations with deduped metadata.
 """
 
+import asyncio
 import os
-import uuid
+import time
 from typing import Optional
 
 import httpx
@@ -19,12 +20,36 @@ SYNC_URL = 'https://api.todoist.com/api/v1/sync'
 mcp = FastMCP('todoist')
 
 
-def _headers() -> dict:
-    """Return headers with auth token."""
-    return {
-        'Authorization': f'Bearer {TODOIST_API_TOKEN}',
-        'Content-Type': 'application/json',
-    }
+# Token is read once at import, so the auth headers never change — build the
+# dict once instead of per request.
+_HEADERS = {
+    'Authorization': f'Bearer {TODOIST_API_TOKEN}',
+    'Content-Type': 'application/json',
+}
+
+
+# Shared client so repeated calls reuse pooled keep-alive connections to
+# api.todoist.com instead of paying a TCP+TLS handshake per request.
+# Lazily created on first use; lives for the life of the process.
+_client_instance: httpx.AsyncClient | None = None
+_client_lock = asyncio.Lock()
+
+
+async def _client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _client_instance
+    if _client_instance is None:
+        async with _client_lock:
+            if _client_instance is None:
+                _client_instance = httpx.AsyncClient(
+                    headers=_HEADERS,
+                    # HTTP/2 multiplexes the parallel tasks/projects/sections
+                    # requests over one connection instead of several sockets
+                    http2=True,
+                    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                    timeout=30,
+                )
+    return _client_instance
 
 
 async def _api(
@@ -40,57 +65,62 @@ async def _api(
     """
     url = f'{BASE_URL}/{endpoint}'
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.request(
-                method,
-                url,
-                headers=_headers(),
-                params=params,
-                json=json_body,
-                timeout=30,
-            )
+    client = await _client()
+    try:
+        response = await client.request(
+            method,
+            url,
+            params=params,
+            json=json_body,
+            timeout=30,
+        )
 
-            if response.status_code == 204:
-                return None, None
+        if response.status_code == 204:
+            return None, None
 
-            if response.status_code >= 400:
-                return None, f'API error {response.status_code}: {response.text}'
+        if response.status_code >= 400:
+            return None, f'API error {response.status_code}: {response.text}'
 
-            data = response.json()
-            # v1 API wraps list responses in {"results": [...]}
-            if isinstance(data, dict) and 'results' in data:
-                data = data['results']
-            return data, None
+        data = response.json()
+        # v1 API wraps list responses in {"results": [...]}
+        if isinstance(data, dict) and 'results' in data:
+            data = data['results']
+        return data, None
 
-        except httpx.TimeoutException:
-            return None, 'Request timed out'
-        except Exception as e:
-            return None, str(e)
+    except httpx.TimeoutException:
+        return None, 'Request timed out'
+    except Exception as e:
+        return None, str(e)
 
 
 async def _sync_api(commands: list) -> tuple[dict | None, str | None]:
     """Make request to Todoist Sync API (for reminders)."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                SYNC_URL,
-                headers=_headers(),
-                json={
-                    'commands': commands,
-                },
-                timeout=30,
-            )
+    client = await _client()
+    try:
+        response = await client.post(
+            SYNC_URL,
+            json={'commands': commands},
+            timeout=30,
+        )
+
+        if response.status_code >= 400:
+            return None, f'Sync API error {response.status_code}: {response.text}'
+
+        return response.json(), None
 
-            if response.status_code >= 400:
-                return None, f'Sync API error {response.status_code}: {response.text}'
+    except httpx.TimeoutException:
+        return None, 'Request timed out'
+    except Exception as e:
+        return None, str(e)
 
-            return response.json(), None
 
-        except httpx.TimeoutException:
-            return None, 'Request timed out'
-        except Exception as e:
-            return None, str(e)
+def _rand_id() -> str:
+    """Random hex token for Sync API temp_id/uuid fields.
+
+    The Sync API only needs uniqueness, not RFC 4122 formatting, so this
+    skips the UUID object construction of uuid.uuid4().
+    """
+    return os.urandom(16).hex()
 
 
 async def _add_comment(task_id: str, content: str) -> tuple[dict | None, str | None]:
@@ -106,11 +136,10 @@ async def _add_reminder(task_id: str, due_string: str) -> tuple[dict | None, str
 
     Note: Reminders require Todoist Premium. Free tier will get an error.
     """
-    temp_id = str(uuid.uuid4())
     commands = [{
         'type': 'reminder_add',
-        'temp_id': temp_id,
-        'uuid': str(uuid.uuid4()),
+        'temp_id': _rand_id(),
+        'uuid': _rand_id(),
         'args': {
             'item_id': task_id,
             'due': {'string': due_string},
@@ -130,6 +159,47 @@ async def _add_reminder(task_id: str, due_string: str) -> tuple[dict | None, str
     return result, None
 
 
+# Projects/sections change rarely compared to how often tasks are listed, so
+# metadata GETs are cached briefly. Any mutating projects() action clears the
+# cache to keep reads consistent.
+_META_TTL = 60  # seconds
+_meta_cache: dict[tuple, tuple[float, tuple]] = {}
+
+# Concurrent identical GETs share one upstream request: the first caller owns
+# the fetch, later callers await its future instead of hitting Todoist again.
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+async def _cached_get(endpoint: str, params: dict = None) -> tuple[dict | list | None, str | None]:
+    """GET via _api with a short TTL cache and in-flight deduplication."""
+    key = (endpoint, tuple(sorted((params or {}).items())))
+    hit = _meta_cache.get(key)
+    if hit and time.monotonic() - hit[0] < _META_TTL:
+        return hit[1]
+
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await fut
+
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await _api('GET', endpoint, params=params)
+        if result[1] is None:
+            _meta_cache[key] = (time.monotonic(), result)
+        fut.set_result(result)
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        _inflight.pop(key, None)
+    return result
+
+
+def _invalidate_metadata_cache():
+    _meta_cache.clear()
+
+
 async def _get_deduped_metadata(tasks: list) -> tuple[dict, dict]:
     """Fetch deduped project and section metadata for task list.
 
@@ -146,24 +216,45 @@ async def _get_deduped_metadata(tasks: list) -> tuple[dict, dict]:
         if task.get('section_id'):
             section_ids.add(task['section_id'])
 
-    # Fetch all projects
-    projects_data, _ = await _api('GET', 'projects')
+    if not project_ids and not section_ids:
+        return {}, {}
+
+    # Sections only need hydrating when some task actually references one
+    section_pids = list(project_ids) if section_ids else []
+
+    # Fetch projects and per-project sections concurrently — none of these
+    # requests depend on each other, so total latency is one RTT, not N+1.
+    # When every task lives in one project, GET /projects/{id} beats pulling
+    # the whole workspace.
+    single_pid = next(iter(project_ids)) if len(project_ids) == 1 else None
+    results = await asyncio.gather(
+        _cached_get(f'projects/{single_pid}' if single_pid else 'projects'),
+        *(_cached_get('sections', params={'project_id': pid}) for pid in section_pids),
+    )
+
+    projects_data, _ = results[0]
     projects_map = {}
-    if projects_data:
+    if single_pid:
+        if projects_data:
+            projects_map[projects_data['id']] = {
+                'name': projects_data['name'],
+                'color': projects_data.get('color'),
+            }
+    elif projects_data:
+        in_pids = project_ids.__contains__  # hoisted for the tight loop
         for p in projects_data:
-            if p['id'] in project_ids:
+            if in_pids(p['id']):
                 projects_map[p['id']] = {
                     'name': p['name'],
                     'color': p.get('color'),
                 }
 
-    # Fetch sections for referenced projects
     sections_map = {}
-    for pid in project_ids:
-        sections_data, _ = await _api('GET', 'sections', params={'project_id': pid})
+    in_sids = section_ids.__contains__
+    for sections_data, _ in results[1:]:
         if sections_data:
             for s in sections_data:
-                if s['id'] in section_ids:
+                if in_sids(s['id']):
                     sections_map[s['id']] = {
                         'name': s['name'],
                         'project_id': s['project_id'],
@@ -172,6 +263,200 @@ async def _get_deduped_metadata(tasks: list) -> tuple[dict, dict]:
     return projects_map, sections_map
 
 
+# Per-action task handlers. All share one keyword signature (unused kwargs
+# swallowed by **_) so tasks() can dispatch via a table instead of an if-chain.
+
+async def _tasks_list(*, project_id=None, section_id=None, filter=None, **_) -> dict:
+    params = {}
+    if project_id:
+        params['project_id'] = project_id
+    if section_id:
+        params['section_id'] = section_id
+    if filter:
+        params['filter'] = filter
+
+    tasks_data, error = await _api('GET', 'tasks', params=params if params else None)
+    if error:
+        return {'error': error}
+
+    if not tasks_data:
+        return {'tasks': [], 'count': 0, 'projects': {}, 'sections': {}}
+
+    # _api already returns the parsed list; hand it straight to the serializer
+    projects_map, sections_map = await _get_deduped_metadata(tasks_data)
+
+    return {
+        'tasks': tasks_data,
+        'count': len(tasks_data),
+        'projects': projects_map,
+        'sections': sections_map,
+    }
+
+
+async def _tasks_get(*, task_id=None, **_) -> dict:
+    task_data, error = await _api('GET', f'tasks/{task_id}')
+    if error:
+        return {'error': error}
+    return {'task': task_data}
+
+
+async def _tasks_create(
+    *, content=None, description=None, project_id=None, section_id=None,
+    priority=None, due_string=None, due_date=None, labels=None,
+    comment=None, reminder=None, **_,
+) -> dict:
+    if not content:
+        return {'error': 'content required for create'}
+
+    body = {'content': content}
+    if description:
+        body['description'] = description
+    if project_id:
+        body['project_id'] = project_id
+    if section_id:
+        body['section_id'] = section_id
+    if priority:
+        body['priority'] = priority
+    if due_string:
+        body['due_string'] = due_string
+    if due_date:
+        body['due_date'] = due_date
+    if labels:
+        body['labels'] = labels
+
+    task_data, error = await _api('POST', 'tasks', json_body=body)
+    if error:
+        return {'error': error}
+
+    created_task_id = task_data['id']
+
+    # Comment and reminder don't depend on each other, so run both at once
+    # instead of stacking two extra round-trips on the create
+    post_ops = []
+    post_labels = []
+    if comment:
+        post_ops.append(_add_comment(created_task_id, comment))
+        post_labels.append('comment')
+    if reminder:
+        post_ops.append(_add_reminder(created_task_id, reminder))
+        post_labels.append('reminder')
+
+    if post_ops:
+        results = await asyncio.gather(*post_ops, return_exceptions=True)
+        failures = []
+        for label, result in zip(post_labels, results):
+            op_error = str(result) if isinstance(result, BaseException) else result[1]
+            if op_error:
+                failures.append(f'{label} failed: {op_error}')
+        if failures:
+            return {
+                'task': task_data,
+                'warning': f'Task created but {"; ".join(failures)}',
+            }
+
+    return {'task': task_data}
+
+
+async def _tasks_update(
+    *, task_id=None, content=None, description=None, priority=None,
+    due_string=None, due_date=None, labels=None, comment=None,
+    section_id=None, **_,
+) -> dict:
+    body = {}
+    if content:
+        body['content'] = content
+    if description is not None:
+        body['description'] = description
+    if priority:
+        body['priority'] = priority
+    if due_string:
+        body['due_string'] = due_string
+    if due_date:
+        body['due_date'] = due_date
+    if labels is not None:
+        body['labels'] = labels
+
+    if not body and not comment and not section_id:
+        return {'error': 'No fields to update'}
+
+    task_data = None
+
+    # Move to section if provided
+    if section_id:
+        _, move_error = await _api('POST', f'tasks/{task_id}/move', json_body={
+            'section_id': section_id,
+        })
+        if move_error:
+            return {'error': f'Failed to move task: {move_error}'}
+
+    # Body update and comment hit different endpoints — run them concurrently
+    ops = []
+    if body:
+        ops.append(_api('POST', f'tasks/{task_id}', json_body=body))
+    if comment:
+        ops.append(_add_comment(task_id, comment))
+    results = await asyncio.gather(*ops, return_exceptions=True) if ops else []
+
+    if body:
+        result = results.pop(0)
+        if isinstance(result, BaseException):
+            return {'error': str(result)}
+        task_data, error = result
+        if error:
+            return {'error': error}
+
+    if comment:
+        result = results.pop(0)
+        comment_error = str(result) if isinstance(result, BaseException) else result[1]
+        if comment_error:
+            return {
+                'task': task_data,
+                'warning': f'Task updated but comment failed: {comment_error}',
+            }
+
+    # If only comment was added, fetch the task
+    if not task_data:
+        task_data, error = await _api('GET', f'tasks/{task_id}')
+        if error:
+            return {'error': error}
+
+    return {'task': task_data}
+
+
+async def _tasks_delete(*, task_id=None, **_) -> dict:
+    _, error = await _api('DELETE', f'tasks/{task_id}')
+    if error:
+        return {'error': error}
+    return {'success': True, 'task_id': task_id}
+
+
+async def _tasks_complete(*, task_id=None, **_) -> dict:
+    _, error = await _api('POST', f'tasks/{task_id}/close')
+    if error:
+        return {'error': error}
+    return {'success': True, 'task_id': task_id}
+
+
+async def _tasks_reopen(*, task_id=None, **_) -> dict:
+    _, error = await _api('POST', f'tasks/{task_id}/reopen')
+    if error:
+        return {'error': error}
+    return {'success': True, 'task_id': task_id}
+
+
+_TASK_HANDLERS = {
+    'list': _tasks_list,
+    'get': _tasks_get,
+    'create': _tasks_create,
+    'update': _tasks_update,
+    'delete': _tasks_delete,
+    'complete': _tasks_complete,
+    'reopen': _tasks_reopen,
+}
+
+_TASK_ACTIONS_NEED_ID = frozenset({'get', 'update', 'delete', 'complete', 'reopen'})
+
+
 @mcp.tool()
 async def tasks(
     action: str,
@@ -214,163 +499,148 @@ async def tasks(
         For delete/complete/reopen: {"success": True}
         On error: {"error": "message", "detail": "..."}
     """
-    valid_actions = ['list', 'get', 'create', 'update', 'delete', 'complete', 'reopen']
-    if action not in valid_actions:
-        return {'error': f'Invalid action: {action}', 'detail': f'Valid actions: {valid_actions}'}
+    handler = _TASK_HANDLERS.get(action)
+    if handler is None:
+        return {'error': f'Invalid action: {action}', 'detail': f'Valid actions: {list(_TASK_HANDLERS)}'}
 
     # Actions that require task_id
-    if action in ['get', 'update', 'delete', 'complete', 'reopen'] and not task_id:
+    if action in _TASK_ACTIONS_NEED_ID and not task_id:
         return {'error': f'task_id required for {action}'}
 
-    # LIST
-    if action == 'list':
-        params = {}
-        if project_id:
-            params['project_id'] = project_id
-        if section_id:
-            params['section_id'] = section_id
-        if filter:
-            params['filter'] = filter
-
-        tasks_data, error = await _api('GET', 'tasks', params=params if params else None)
-        if error:
-            return {'error': error}
+    return await handler(
+        task_id=task_id,
+        project_id=project_id,
+        section_id=section_id,
+        filter=filter,
+        content=content,
+        description=description,
+        priority=priority,
+        due_string=due_string,
+        due_date=due_date,
+        labels=labels,
+        comment=comment,
+        reminder=reminder,
+    )
+
+
+# Per-action project handlers, dispatched the same way as the task handlers.
+
+async def _projects_list(**_) -> dict:
+    projects_data, error = await _api('GET', 'projects')
+    if error:
+        return {'error': error}
+    return {
+        'projects': projects_data or [],
+        'count': len(projects_data or []),
+    }
 
-        tasks_list = tasks_data or []
-        projects_map, sections_map = await _get_deduped_metadata(tasks_list)
 
-        return {
-            'tasks': tasks_list,
-            'count': len(tasks_list),
-            'projects': projects_map,
-            'sections': sections_map,
-        }
+async def _projects_get(*, project_id=None, **_) -> dict:
+    project_data, error = await _api('GET', f'projects/{project_id}')
+    if error:
+        return {'error': error}
 
-    # GET
-    if action == 'get':
-        task_data, error = await _api('GET', f'tasks/{task_id}')
-        if error:
-            return {'error': error}
-        return {'task': task_data}
-
-    # CREATE
-    if action == 'create':
-        if not content:
-            return {'error': 'content required for create'}
-
-        body = {'content': content}
-        if description:
-            body['description'] = description
-        if project_id:
-            body['project_id'] = project_id
-        if section_id:
-            body['section_id'] = section_id
-        if priority:
-            body['priority'] = priority
-        if due_string:
-            body['due_string'] = due_string
-        if due_date:
-            body['due_date'] = due_date
-        if labels:
-            body['labels'] = labels
-
-        task_data, error = await _api('POST', 'tasks', json_body=body)
-        if error:
-            return {'error': error}
+    sections_data, _ = await _api('GET', 'sections', params={'project_id': project_id})
 
-        created_task_id = task_data['id']
+    return {
+        'project': project_data,
+        'sections': sections_data or [],
+    }
 
-        # Add comment if provided
-        if comment:
-            _, comment_error = await _add_comment(created_task_id, comment)
-            if comment_error:
-                return {
-                    'task': task_data,
-                    'warning': f'Task created but comment failed: {comment_error}',
-                }
 
-        # Add reminder if provided (Premium only)
-        if reminder:
-            _, reminder_error = await _add_reminder(created_task_id, reminder)
-            if reminder_error:
-                return {
-                    'task': task_data,
-                    'warning': f'Task created but reminder failed: {reminder_error}',
-                }
+async def _projects_create(*, name=None, color=None, is_favorite=None, view_style=None, **_) -> dict:
+    if not name:
+        return {'error': 'name required for create'}
 
-        return {'task': task_data}
-
-    # UPDATE
-    if action == 'update':
-        body = {}
-        if content:
-            body['content'] = content
-        if description is not None:
-            body['description'] = description
-        if priority:
-            body['priority'] = priority
-        if due_string:
-            body['due_string'] = due_string
-        if due_date:
-            body['due_date'] = due_date
-        if labels is not None:
-            body['labels'] = labels
-
-        if not body and not comment and not section_id:
-            return {'error': 'No fields to update'}
-
-        task_data = None
-
-        # Move to section if provided
-        if section_id:
-            _, move_error = await _api('POST', f'tasks/{task_id}/move', json_body={
-                'section_id': section_id,
-            })
-            if move_error:
-                return {'error': f'Failed to move task: {move_error}'}
-
-        if body:
-            task_data, error = await _api('POST', f'tasks/{task_id}', json_body=body)
-            if error:
-                return {'error': error}
-
-        # Add comment if provided
-        if comment:
-            _, comment_error = await _add_comment(task_id, comment)
-            if comment_error:
-                return {
-                    'task': task_data,
-                    'warning': f'Task updated but comment failed: {comment_error}',
-                }
+    body = {'name': name}
+    if color:
+        body['color'] = color
+    if is_favorite is not None:
+        body['is_favorite'] = is_favorite
+    if view_style:
+        body['view_style'] = view_style
 
-        # If only comment was added, fetch the task
-        if not task_data:
-            task_data, error = await _api('GET', f'tasks/{task_id}')
-            if error:
-                return {'error': error}
+    project_data, error = await _api('POST', 'projects', json_body=body)
+    if error:
+        return {'error': error}
+    return {'project': project_data}
 
-        return {'task': task_data}
 
-    # DELETE
-    if action == 'delete':
-        _, error = await _api('DELETE', f'tasks/{task_id}')
-        if error:
-            return {'error': error}
-        return {'success': True, 'task_id': task_id}
+async def _projects_update(*, project_id=None, name=None, color=None, is_favorite=None, view_style=None, **_) -> dict:
+    body = {}
+    if name:
+        body['name'] = name
+    if color:
+        body['color'] = color
+    if is_favorite is not None:
+        body['is_favorite'] = is_favorite
+    if view_style:
+        body['view_style'] = view_style
 
-    # COMPLETE
-    if action == 'complete':
-        _, error = await _api('POST', f'tasks/{task_id}/close')
-        if error:
-            return {'error': error}
-        return {'success': True, 'task_id': task_id}
+    if not body:
+        return {'error': 'No fields to update'}
 
-    # REOPEN
-    if action == 'reopen':
-        _, error = await _api('POST', f'tasks/{task_id}/reopen')
-        if error:
-            return {'error': error}
-        return {'success': True, 'task_id': task_id}
+    project_data, error = await _api('POST', f'projects/{project_id}', json_body=body)
+    if error:
+        return {'error': error}
+    return {'project': project_data}
+
+
+async def _projects_delete(*, project_id=None, **_) -> dict:
+    _, error = await _api('DELETE', f'projects/{project_id}')
+    if error:
+        return {'error': error}
+    return {'success': True, 'project_id': project_id}
+
+
+async def _projects_list_sections(*, project_id=None, **_) -> dict:
+    sections_data, error = await _api('GET', 'sections', params={'project_id': project_id})
+    if error:
+        return {'error': error}
+    return {
+        'sections': sections_data or [],
+        'count': len(sections_data or []),
+    }
+
+
+async def _projects_add_section(*, project_id=None, section_name=None, section_order=None, **_) -> dict:
+    if not section_name:
+        return {'error': 'section_name required for add_section'}
+
+    body = {
+        'project_id': project_id,
+        'name': section_name,
+    }
+    if section_order is not None:
+        body['order'] = section_order
+
+    section_data, error = await _api('POST', 'sections', json_body=body)
+    if error:
+        return {'error': error}
+    return {'section': section_data}
+
+
+async def _projects_delete_section(*, section_id=None, **_) -> dict:
+    _, error = await _api('DELETE', f'sections/{section_id}')
+    if error:
+        return {'error': error}
+    return {'success': True, 'section_id': section_id}
+
+
+_PROJECT_HANDLERS = {
+    'list': _projects_list,
+    'get': _projects_get,
+    'create': _projects_create,
+    'update': _projects_update,
+    'delete': _projects_delete,
+    'list_sections': _projects_list_sections,
+    'add_section': _projects_add_section,
+    'delete_section': _projects_delete_section,
+}
+
+_PROJECT_ACTIONS_NEED_ID = frozenset({'get', 'update', 'delete', 'list_sections', 'add_section'})
+
+_PROJECT_MUTATING_ACTIONS = frozenset({'create', 'update', 'delete', 'add_section', 'delete_section'})
 
 
 @mcp.tool()
@@ -410,117 +680,29 @@ async def projects(
         For delete/delete_section: {"success": True}
         On error: {"error": "message"}
     """
-    valid_actions = ['list', 'get', 'create', 'update', 'delete',
-                     'list_sections', 'add_section', 'delete_section']
-    if action not in valid_actions:
-        return {'error': f'Invalid action: {action}', 'detail': f'Valid actions: {valid_actions}'}
+    handler = _PROJECT_HANDLERS.get(action)
+    if handler is None:
+        return {'error': f'Invalid action: {action}', 'detail': f'Valid actions: {list(_PROJECT_HANDLERS)}'}
 
     # Actions that require project_id
-    if action in ['get', 'update', 'delete', 'list_sections', 'add_section'] and not project_id:
+    if action in _PROJECT_ACTIONS_NEED_ID and not project_id:
         return {'error': f'project_id required for {action}'}
 
     # Actions that require section_id
     if action == 'delete_section' and not section_id:
         return {'error': 'section_id required for delete_section'}
 
-    # LIST
-    if action == 'list':
-        projects_data, error = await _api('GET', 'projects')
-        if error:
-            return {'error': error}
-        return {
-            'projects': projects_data or [],
-            'count': len(projects_data or []),
-        }
-
-    # GET (includes sections)
-    if action == 'get':
-        project_data, error = await _api('GET', f'projects/{project_id}')
-        if error:
-            return {'error': error}
-
-        sections_data, _ = await _api('GET', 'sections', params={'project_id': project_id})
-
-        return {
-            'project': project_data,
-            'sections': sections_data or [],
-        }
-
-    # CREATE
-    if action == 'create':
-        if not name:
-            return {'error': 'name required for create'}
-
-        body = {'name': name}
-        if color:
-            body['color'] = color
-        if is_favorite is not None:
-            body['is_favorite'] = is_favorite
-        if view_style:
-            body['view_style'] = view_style
-
-        project_data, error = await _api('POST', 'projects', json_body=body)
-        if error:
-            return {'error': error}
-        return {'project': project_data}
-
-    # UPDATE
-    if action == 'update':
-        body = {}
-        if name:
-            body['name'] = name
-        if color:
-            body['color'] = color
-        if is_favorite is not None:
-            body['is_favorite'] = is_favorite
-        if view_style:
-            body['view_style'] = view_style
-
-        if not body:
-            return {'error': 'No fields to update'}
-
-        project_data, error = await _api('POST', f'projects/{project_id}', json_body=body)
-        if error:
-            return {'error': error}
-        return {'project': project_data}
-
-    # DELETE
-    if action == 'delete':
-        _, error = await _api('DELETE', f'projects/{project_id}')
-        if error:
-            return {'error': error}
-        return {'success': True, 'project_id': project_id}
-
-    # LIST_SECTIONS
-    if action == 'list_sections':
-        sections_data, error = await _api('GET', 'sections', params={'project_id': project_id})
-        if error:
-            return {'error': error}
-        return {
-            'sections': sections_data or [],
-            'count': len(sections_data or []),
-        }
-
-    # ADD_SECTION
-    if action == 'add_section':
-        if not section_name:
-            return {'error': 'section_name required for add_section'}
-
-        body = {
-            'project_id': project_id,
-            'name': section_name,
-        }
-        if section_order is not None:
-            body['order'] = section_order
-
-        section_data, error = await _api('POST', 'sections', json_body=body)
-        if error:
-            return {'error': error}
-        return {'section': section_data}
-
-    # DELETE_SECTION
-    if action == 'delete_section':
-        _, error = await _api('DELETE', f'sections/{section_id}')
-        if error:
-            return {'error': error}
-        return {'success': True, 'section_id': section_id}
+    # Mutations make the cached metadata stale
+    if action in _PROJECT_MUTATING_ACTIONS:
+        _invalidate_metadata_cache()
+
+    return await handler(
+        project_id=project_id,
+        section_id=section_id,
+        name=name,
+        color=color,
+        is_favorite=is_favorite,
+        view_style=view_style,
+        section_name=section_name,
+        section_order=section_order,
+    )
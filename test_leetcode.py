@@ -8,6 +8,38 @@ import httpx
 LEETCODE_SESSION = os.environ.get("LEETCODE_SESSION", "")
 GRAPHQL_URL = "https://leetcode.com/graphql"
 
+# Single static query document (module-level, built once) + variables so the
+# server sees the same query text every call and can reuse its parsed/plan
+# caches. The four probes (user status, two type introspections, company
+# problem listing) are independent, so aliased top-level fields collapse
+# them into one round trip.
+_Q_PROBE = """
+query ($filterType: String!, $enumType: String!, $slugs: [String!], $limit: Int!, $skip: Int!) {
+    userStatus { username isPremium }
+    filterType: __type(name: $filterType) {
+        name
+        inputFields {
+            name
+            type { name kind ofType { name kind } }
+        }
+    }
+    combineEnum: __type(name: $enumType) {
+        enumValues { name }
+    }
+    problemsetQuestionListV2(limit: $limit, skip: $skip, filters: {
+        filterCombineType: ALL
+        companyFilter: {companySlugs: $slugs}
+    }) {
+        totalLength
+        questions {
+            title
+            titleSlug
+            difficulty
+        }
+    }
+}
+"""
+
 
 def get_headers():
     return {
@@ -17,6 +49,15 @@ def get_headers():
     }
 
 
+async def gql(client, query, variables=None):
+    """POST a GraphQL query with variables; returns the decoded response."""
+    resp = await client.post(
+        GRAPHQL_URL,
+        json={"query": query, "variables": variables or {}},
+    )
+    return resp
+
+
 async def test():
     if not LEETCODE_SESSION:
         print("ERROR: LEETCODE_SESSION not set")
@@ -24,91 +65,38 @@ async def test():
 
     print(f"Session token: {LEETCODE_SESSION[:50]}...")
 
-    async with httpx.AsyncClient() as client:
-        # First check user status
-        resp = await client.post(
-            GRAPHQL_URL,
-            json={"query": "query { userStatus { username isPremium }}"},
-            headers=get_headers(),
-            timeout=60,
-        )
-        print(f"User: {resp.json()}")
-
-        # Introspect CompanyFilter type
-        print("\\nIntrospecting CompanyFilter...")
-        query = """
-        query {
-            __type(name: "CompanyFilter") {
-                name
-                inputFields {
-                    name
-                    type { name kind ofType { name kind } }
-                }
-            }
-        }
-        """
-        resp = await client.post(
-            GRAPHQL_URL,
-            json={"query": query},
-            headers=get_headers(),
-            timeout=60,
-        )
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+    async with httpx.AsyncClient(
+        http2=True, limits=limits, headers=get_headers(), timeout=60
+    ) as client:
+        resp = await gql(client, _Q_PROBE, {
+            "filterType": "CompanyFilter",
+            "enumType": "QuestionFilterCombineTypeEnum",
+            "slugs": ["google"],
+            "limit": 5,
+            "skip": 0,
+        })
+        print(f"Status: {resp.status_code} ({resp.http_version})")
         data = resp.json()
-        fields = data.get("data", {}).get("__type", {}).get("inputFields", [])
+        if "errors" in data:
+            print(f"Errors: {data['errors']}")
+
+        payload = data.get("data") or {}
+        print(f"User: {payload.get('userStatus')}")
+
+        fields = (payload.get("filterType") or {}).get("inputFields", [])
         print("CompanyFilter fields:")
         for f in fields:
             print(f"  - {f}")
 
-        # Get enum values
-        print("\\nGetting QuestionFilterCombineTypeEnum...")
-        query_enum = """
-        query {
-            __type(name: "QuestionFilterCombineTypeEnum") {
-                enumValues { name }
-            }
-        }
-        """
-        resp = await client.post(
-            GRAPHQL_URL,
-            json={"query": query_enum},
-            headers=get_headers(),
-            timeout=60,
-        )
-        data = resp.json()
-        vals = data.get("data", {}).get("__type", {}).get("enumValues", [])
+        vals = (payload.get("combineEnum") or {}).get("enumValues", [])
         print(f"Enum values: {[v.get('name') for v in vals]}")
 
-        # Try with enum value directly in query (not as variable)
-        print("\\nTrying with hardcoded enum...")
-        query2 = """
-        query {
-            problemsetQuestionListV2(filters: {
-                filterCombineType: ALL
-                companyFilter: {companySlugs: ["google"]}
-            }) {
-                questions {
-                    title
-                    titleSlug
-                    difficulty
-                }
-            }
-        }
-        """
-        resp = await client.post(
-            GRAPHQL_URL,
-            json={"query": query2},
-            headers=get_headers(),
-            timeout=60,
-        )
-        print(f"Status: {resp.status_code}")
-        data = resp.json()
-        if "errors" in data:
-            print(f"Errors: {data['errors']}")
-        else:
-            qs = data.get("data", {}).get("problemsetQuestionListV2", {}).get("questions", [])
-            print(f"Found {len(qs)} problems")
-            for q in qs[:5]:
-                print(f"  - {q.get('title')} ({q.get('difficulty')})")
+        listing = payload.get("problemsetQuestionListV2") or {}
+        qs = listing.get("questions", [])
+        print(f"Found {listing.get('totalLength')} problems ({len(qs)} fetched)")
+        for q in qs:
+            print(f"  - {q.get('title')} ({q.get('difficulty')})")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ from pathlib import Path
 router_path = Path(__file__).parent.parent / "router"
 sys.path.insert(0, str(router_path))
 
+import re
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from email.message import EmailMessage
@@ -62,11 +64,23 @@ class MockIMAPResponse:
         self.lines = lines or []
 
 
+# Extracts the quoted search term from criteria like 'OR FROM "x" SUBJECT "x"'
+_QUOTE_RE = re.compile(r'"([^"]+)"')
+
+
 class MockIMAPClient:
     """Mock aioimaplib IMAP4 client."""
 
-    def __init__(self, emails: list = None):
+    def __init__(self, emails: list = None, prebuilt_bytes: dict = None):
         self.emails = {e['id']: e for e in (emails or MOCK_EMAILS)}
+        # Lowercased once so search is a single pass without per-query .lower()
+        self._index = [
+            (eid, e['from'].lower(), e['subject'].lower())
+            for eid, e in self.emails.items()
+        ]
+        # Optional {eid: (headers_bytes, full_bytes)} so fetch doesn't
+        # re-serialize an EmailMessage per call
+        self._bytes = prebuilt_bytes or {}
         self.selected_mailbox = None
         self.logged_in = False
 
@@ -81,84 +95,190 @@ class MockIMAPClient:
         self.logged_in = False
         return MockIMAPResponse('OK')
 
+    async def noop(self):
+        return MockIMAPResponse('OK')
+
     async def select(self, mailbox: str = 'INBOX'):
         self.selected_mailbox = mailbox
         return MockIMAPResponse('OK')
 
     async def search(self, criteria: str = 'ALL'):
-        # Simple search simulation
+        # Simple search simulation over the prebuilt lowercase index
         if criteria == 'ALL':
             ids = list(self.emails.keys())
         else:
-            # Search in FROM and SUBJECT
-            ids = []
-            for eid, email in self.emails.items():
-                criteria_lower = criteria.lower()
-                if (email['from'].lower() in criteria_lower or
-                    criteria_lower in email['from'].lower() or
-                    email['subject'].lower() in criteria_lower or
-                    criteria_lower in email['subject'].lower()):
-                    ids.append(eid)
-            # If no specific match, return all (simplified)
-            if not ids and 'OR' in criteria:
-                # Extract search term from OR FROM "term" SUBJECT "term"
-                import re
-                match = re.search(r'"([^"]+)"', criteria)
-                if match:
-                    term = match.group(1).lower()
-                    for eid, email in self.emails.items():
-                        if term in email['from'].lower() or term in email['subject'].lower():
-                            ids.append(eid)
+            match = _QUOTE_RE.search(criteria)
+            term = match.group(1).lower() if match else criteria.lower()
+            ids = [eid for eid, from_, subject in self._index
+                   if term in from_ or term in subject]
 
         return MockIMAPResponse('OK', [' '.join(ids).encode()])
 
+    @staticmethod
+    def _expand_sequence(msg_set: str) -> list[str]:
+        """Expand an IMAP sequence set ('1:3,7') into individual IDs."""
+        ids = []
+        for token in msg_set.split(','):
+            if ':' in token:
+                lo, hi = token.split(':')
+                ids.extend(str(n) for n in range(int(lo), int(hi) + 1))
+            else:
+                ids.append(token)
+        return ids
+
     async def fetch(self, msg_id: str, parts: str):
-        email = self.emails.get(msg_id)
-        if not email:
+        # Accepts message sets ('1,2,3' or '1:3') like a real server and
+        # interleaves
+        # '<seq> FETCH (...' metadata lines with payload literals, matching
+        # the aioimaplib response shape
+        headers_only = 'HEADER' in parts
+        lines = []
+        for mid in self._expand_sequence(msg_id):
+            email = self.emails.get(mid)
+            if not email:
+                continue
+            pair = self._bytes.get(mid)
+            if pair is not None:
+                email_bytes = pair[0] if headers_only else pair[1]
+            else:
+                email_bytes = create_mock_email_bytes(email, headers_only=headers_only)
+            lines.append(f'{mid} FETCH (BODY[] {{{len(email_bytes)}}}'.encode())
+            lines.append(email_bytes)
+            lines.append(b')')
+
+        if not lines:
             return MockIMAPResponse('NO', [])
+        return MockIMAPResponse('OK', lines)
 
-        headers_only = 'HEADER' in parts
-        email_bytes = create_mock_email_bytes(email, headers_only=headers_only)
 
-        return MockIMAPResponse('OK', [email_bytes])
+# A second mailbox for multi-mailbox search tests. Dates straddle the INBOX
+# range so merge-and-sort across mailboxes is observable.
+MOCK_ARCHIVE_EMAILS = [
+    {
+        'id': '11',
+        'from': 'dave@example.com',
+        'subject': 'Archived report',
+        'date': 'Thu, 29 Jan 2026 08:00:00 -0800',
+    },
+    {
+        'id': '12',
+        'from': 'erin@example.com',
+        'subject': 'Old thread',
+        'date': 'Sun, 26 Jan 2026 12:00:00 -0800',
+    },
+]
 
 
-@pytest.fixture
+class MockMultiMailboxIMAPClient(MockIMAPClient):
+    """Mock IMAP client serving several mailboxes, routed by SELECT."""
+
+    def __init__(self, mailboxes: dict):
+        super().__init__(next(iter(mailboxes.values())))
+        self._mailboxes = mailboxes
+
+    async def select(self, mailbox: str = 'INBOX'):
+        emails = self._mailboxes.get(mailbox)
+        if emails is None:
+            # Real servers answer NO for nonexistent mailboxes
+            return MockIMAPResponse('NO')
+        self.emails = {e['id']: e for e in emails}
+        self._index = [
+            (eid, e['from'].lower(), e['subject'].lower())
+            for eid, e in self.emails.items()
+        ]
+        return await super().select(mailbox)
+
+
+@pytest.fixture(scope='session')
 def mock_emails():
-    """Provide mock email data."""
-    return MOCK_EMAILS.copy()
+    """Provide mock email data (shared read-only across the session)."""
+    return tuple(MOCK_EMAILS)
+
+
+@pytest.fixture(scope='session')
+def mock_email_bytes():
+    """Serialize each mock email once per session, in both fetch shapes."""
+    return {
+        e['id']: (
+            create_mock_email_bytes(e, headers_only=True),
+            create_mock_email_bytes(e, headers_only=False),
+        )
+        for e in MOCK_EMAILS
+    }
 
 
 @pytest.fixture
-def mock_imap_client(mock_emails):
+def mock_imap_client(mock_emails, mock_email_bytes):
     """Create a mock IMAP client with test data."""
-    return MockIMAPClient(mock_emails)
+    return MockIMAPClient(list(mock_emails), prebuilt_bytes=mock_email_bytes)
 
 
 @pytest.fixture
 def patch_imap(mock_imap_client):
     """Patch aioimaplib.IMAP4 to return mock client."""
+    from router.backends import email as email_backend
+
+    # Drop pooled sessions so each test connects through its own mock
+    email_backend._imap_pool.clear()
     with patch('router.backends.email.IMAP4') as mock_class:
         mock_class.return_value = mock_imap_client
         yield mock_imap_client
+    email_backend._imap_pool.clear()
+
+
+@pytest.fixture
+def patch_imap_multi():
+    """Patch aioimaplib.IMAP4 with mailbox-aware mocks for parallel search.
+
+    Unlike patch_imap, each connect gets a fresh client instance so pooled
+    slots searching different mailboxes keep their own SELECT state.
+    """
+    from router.backends import email as email_backend
+
+    mailboxes = {
+        'INBOX': MOCK_EMAILS,
+        'Archive': MOCK_ARCHIVE_EMAILS,
+    }
+    email_backend._imap_pool.clear()
+    with patch('router.backends.email.IMAP4') as mock_class:
+        mock_class.side_effect = (
+            lambda *args, **kwargs: MockMultiMailboxIMAPClient(mailboxes)
+        )
+        yield mailboxes
+    email_backend._imap_pool.clear()
 
 
 @pytest.fixture
 def patch_smtp():
-    """Patch aiosmtplib.send to capture sent emails."""
+    """Patch aiosmtplib.SMTP to capture sent emails."""
     sent_emails = []
 
-    async def mock_send(msg, **kwargs):
-        sent_emails.append({
-            'to': msg['To'],
-            'from': msg['From'],
-            'subject': msg['Subject'],
-            'body': msg.get_content(),
-            'kwargs': kwargs,
-        })
+    class MockSMTP:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+        async def connect(self):
+            pass
+
+        async def login(self, user: str, password: str):
+            pass
+
+        async def send_message(self, msg):
+            sent_emails.append({
+                'to': msg['To'],
+                'from': msg['From'],
+                'subject': msg['Subject'],
+                'body': msg.get_content(),
+                'kwargs': self.kwargs,
+            })
+
+    from router.backends import email as email_backend
 
-    with patch('aiosmtplib.send', side_effect=mock_send):
+    # Drop any pooled session so each test connects through its own mock
+    email_backend._smtp = None
+    with patch('router.backends.email.aiosmtplib.SMTP', MockSMTP):
         yield sent_emails
+    email_backend._smtp = None
 
 
 @pytest.fixture
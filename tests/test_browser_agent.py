@@ -4,8 +4,14 @@ These tests verify that the browser backend correctly extracts content
 and interactive elements in a format suitable for AI agents.
 """
 
-import pytest
 import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'router'))
+from backends import browser
 
 
 @pytest.fixture(scope="module")
@@ -19,25 +25,28 @@ def event_loop():
 @pytest.fixture(scope="module")
 async def browser_page():
     """Get a connected browser page."""
-    import sys
-    sys.path.insert(0, 'router')
-    from backends import browser
-
     page = await browser.get_page()
     yield page
 
 
+@pytest.fixture(scope="module")
+async def agent_content(browser_page):
+    """Extract agent-format content once per module.
+
+    Read-only tests share this instead of re-scraping the DOM per test;
+    tests that check side effects (e.g. _element_map) still call
+    get_content themselves.
+    """
+    return await browser.get_content.fn(format="agent")
+
+
 class TestAgentContentExtraction:
     """Tests for format='agent' content extraction."""
 
     @pytest.mark.asyncio
-    async def test_get_content_agent_format_returns_expected_keys(self, browser_page):
+    async def test_get_content_agent_format_returns_expected_keys(self, agent_content):
         """Verify agent format returns content, elements, and usage info."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
-        result = await browser.get_content.fn(format="agent")
+        result = agent_content
 
         assert 'url' in result
         assert 'title' in result
@@ -47,14 +56,9 @@ class TestAgentContentExtraction:
         assert 'usage' in result
 
     @pytest.mark.asyncio
-    async def test_content_is_clean_text(self, browser_page):
+    async def test_content_is_clean_text(self, agent_content):
         """Verify content is clean text without HTML/JSON cruft."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
-        result = await browser.get_content.fn(format="agent")
-        content = result['content']
+        content = agent_content['content']
 
         # Should not contain HTML tags
         assert '<div' not in content
@@ -70,13 +74,9 @@ class TestAgentContentExtraction:
         assert len(content) < 50000  # Not bloated
 
     @pytest.mark.asyncio
-    async def test_elements_have_refs(self, browser_page):
+    async def test_elements_have_refs(self, agent_content):
         """Verify interactive elements have usable refs."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
-        result = await browser.get_content.fn(format="agent")
+        result = agent_content
         elements = result['elements']
 
         # Should have elements
@@ -88,10 +88,6 @@ class TestAgentContentExtraction:
     @pytest.mark.asyncio
     async def test_element_refs_are_usable(self, browser_page):
         """Verify element refs can be used with click/type_text."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
         # First get content to populate element map
         result = await browser.get_content.fn(format="agent")
 
@@ -115,10 +111,6 @@ class TestAgentInteraction:
     @pytest.mark.asyncio
     async def test_click_with_unknown_ref_returns_error(self, browser_page):
         """Verify click with unknown ref gives helpful error."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
         result = await browser.click.fn(ref="nonexistent-99")
 
         assert 'error' in result
@@ -127,10 +119,6 @@ class TestAgentInteraction:
     @pytest.mark.asyncio
     async def test_type_text_with_unknown_ref_returns_error(self, browser_page):
         """Verify type_text with unknown ref gives helpful error."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
         result = await browser.type_text.fn(text="test", ref="nonexistent-99")
 
         assert 'error' in result
@@ -139,10 +127,6 @@ class TestAgentInteraction:
     @pytest.mark.asyncio
     async def test_click_requires_selector_or_ref(self, browser_page):
         """Verify click requires either selector or ref."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
         result = await browser.click.fn()
 
         assert 'error' in result
@@ -155,10 +139,6 @@ class TestContentFormats:
     @pytest.mark.asyncio
     async def test_text_format(self, browser_page):
         """Verify text format returns clean text."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
         result = await browser.get_content.fn(format="text")
 
         assert 'text' in result
@@ -168,10 +148,6 @@ class TestContentFormats:
     @pytest.mark.asyncio
     async def test_html_format(self, browser_page):
         """Verify html format returns HTML."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
         result = await browser.get_content.fn(format="html")
 
         assert 'html' in result
@@ -182,10 +158,6 @@ class TestContentFormats:
     @pytest.mark.asyncio
     async def test_max_length_truncation(self, browser_page):
         """Verify content is truncated to max_length."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
         result = await browser.get_content.fn(format="text", max_length=500)
 
         assert len(result['text']) <= 600  # Allow for truncation message
@@ -195,13 +167,9 @@ class TestLinkedInSpecific:
     """Tests specific to LinkedIn page structure."""
 
     @pytest.mark.asyncio
-    async def test_linkedin_messages_visible(self, browser_page):
+    async def test_linkedin_messages_visible(self, agent_content):
         """Verify LinkedIn message content is extracted."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
-        result = await browser.get_content.fn(format="agent")
+        result = agent_content
         content = result['content'].lower()
 
         # Should see messaging-related content (if on messaging page)
@@ -215,13 +183,9 @@ class TestLinkedInSpecific:
         assert has_messaging_content or 'linkedin' not in result['url'].lower()
 
     @pytest.mark.asyncio
-    async def test_linkedin_interactive_elements(self, browser_page):
+    async def test_linkedin_interactive_elements(self, agent_content):
         """Verify LinkedIn interactive elements are found."""
-        import sys
-        sys.path.insert(0, 'router')
-        from backends import browser
-
-        result = await browser.get_content.fn(format="agent")
+        result = agent_content
 
         # Should find interactive elements on any LinkedIn page
         if 'linkedin' in result['url'].lower():
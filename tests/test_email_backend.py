@@ -83,6 +83,34 @@ class TestSearchEmails:
 
         assert len(result) <= 1
 
+    async def test_search_emails_multiple_mailboxes(self, patch_imap_multi, env_vars):
+        """Should merge results from comma-separated mailboxes, newest first."""
+        from router.backends.email import search_emails, parse_email_date
+
+        result = await call_tool(
+            search_emails, query='example', mailbox='INBOX,Archive', limit=10
+        )
+
+        ids = {e['id'] for e in result}
+        assert {'1', '2', '3'} <= ids  # INBOX matches
+        assert {'11', '12'} <= ids     # Archive matches
+
+        # Merged list is sorted across mailboxes, not per-mailbox
+        dates = [parse_email_date(e['date']) for e in result]
+        assert dates == sorted(dates, reverse=True)
+        assert result[0]['id'] == '11'   # Archive's Jan 29 email leads
+        assert result[-1]['id'] == '12'  # and its Jan 26 email trails
+
+    async def test_search_emails_unselectable_mailbox(self, patch_imap_multi, env_vars):
+        """A mailbox that fails SELECT contributes nothing, not another folder's mail."""
+        from router.backends.email import search_emails
+
+        result = await call_tool(
+            search_emails, query='example', mailbox='INBOX,Nonexistent', limit=10
+        )
+
+        assert {e['id'] for e in result} == {'1', '2', '3'}
+
     async def test_search_emails_empty_query_returns_results(self, patch_imap, env_vars):
         """Should handle searches that find nothing gracefully."""
         from router.backends.email import search_emails
@@ -3,6 +3,7 @@
 import json
 import os
 import pytest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
 from backends import notifications
@@ -125,8 +126,9 @@ class TestList:
         assert result["notifications"][0]["id"] == r1["id"]
 
     async def test_list_respects_limit(self):
-        for i in range(5):
-            await _push(level="info", source="a", title=f"N{i}")
+        await notifications._insert_many(
+            [("info", "a", f"N{i}") for i in range(5)],
+        )
 
         result = await _list(limit=2)
         assert result["count"] == 2
@@ -162,10 +164,9 @@ class TestMarkRead:
         assert detail["notification"]["read_at"] is not None
 
     async def test_mark_multiple_read(self):
-        ids = []
-        for i in range(3):
-            r = await _push(level="info", source="a", title=f"N{i}")
-            ids.append(r["id"])
+        ids = await notifications._insert_many(
+            [("info", "a", f"N{i}") for i in range(3)],
+        )
 
         result = await _mark_read(ids)
         assert result["marked"] == 3
@@ -222,9 +223,11 @@ class TestSummary:
         assert result["by_level"] == {}
 
     async def test_summary_counts(self):
-        await _push(level="info", source="radar", title="R1")
-        await _push(level="info", source="radar", title="R2")
-        await _push(level="error", source="lab", title="L1")
+        await notifications._insert_many([
+            ("info", "radar", "R1"),
+            ("info", "radar", "R2"),
+            ("error", "lab", "L1"),
+        ])
 
         result = await _summary()
         assert result["total_unread"] == 3
@@ -240,26 +243,53 @@ class TestSummary:
         assert result["total_unread"] == 1
 
 
+class TestAutoCleanup:
+    """Tests for expiry pruning during list."""
+
+    async def test_expired_notification_pruned(self):
+        # Caller-supplied ISO-8601 ('T' separator, offset) must compare
+        # correctly against SQLite's space-separated now
+        past = (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat()
+        await _push(level="info", source="a", title="Expired", expires_at=past)
+        await _push(level="info", source="a", title="Keeps")
+
+        result = await _list()
+        titles = [n["title"] for n in result["notifications"]]
+        assert titles == ["Keeps"]
+
+    async def test_future_expiry_survives(self):
+        future = (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat()
+        await _push(level="info", source="a", title="Later", expires_at=future)
+
+        result = await _list()
+        assert result["count"] == 1
+
+
 # ---------------------------------------------------------------------------
 # HTTP route tests
 # ---------------------------------------------------------------------------
 
-from starlette.testclient import TestClient
+import httpx
 from starlette.applications import Starlette
-from starlette.routing import Mount
 
 @pytest.fixture
-def client():
-    """Create a test client with notification HTTP routes mounted."""
+async def client():
+    """Create an async test client with notification HTTP routes mounted.
+
+    httpx.ASGITransport drives the app in-process on the test's own event
+    loop — no thread hop per request like Starlette's TestClient.
+    """
     app = Starlette(routes=notifications.notify_http_routes)
-    return TestClient(app)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://test') as c:
+        yield c
 
 
 class TestHTTPPush:
     """Tests for POST /notifications/push."""
 
-    def test_push_ok(self, client):
-        resp = client.post("/notifications/push", json={
+    async def test_push_ok(self, client):
+        resp = await client.post("/notifications/push", json={
             "level": "info", "source": "test", "title": "Hello",
         })
         assert resp.status_code == 200
@@ -267,105 +297,105 @@ class TestHTTPPush:
         assert "id" in data
         assert data["title"] == "Hello"
 
-    def test_push_missing_fields(self, client):
-        resp = client.post("/notifications/push", json={"level": "info"})
+    async def test_push_missing_fields(self, client):
+        resp = await client.post("/notifications/push", json={"level": "info"})
         assert resp.status_code == 400
         assert "Missing" in resp.json()["error"]
 
-    def test_push_invalid_level(self, client):
-        resp = client.post("/notifications/push", json={
+    async def test_push_invalid_level(self, client):
+        resp = await client.post("/notifications/push", json={
             "level": "critical", "source": "test", "title": "Bad",
         })
         assert resp.status_code == 400
 
-    def test_push_with_metadata(self, client):
-        resp = client.post("/notifications/push", json={
+    async def test_push_with_metadata(self, client):
+        resp = await client.post("/notifications/push", json={
             "level": "info", "source": "test", "title": "With meta",
             "metadata": {"report_id": "abc"},
         })
         assert resp.status_code == 200
         nid = resp.json()["id"]
 
-        detail = client.get(f"/notifications/{nid}")
+        detail = await client.get(f"/notifications/{nid}")
         assert detail.json()["notification"]["metadata"]["report_id"] == "abc"
 
 
 class TestHTTPList:
     """Tests for GET /notifications."""
 
-    def test_list_empty(self, client):
-        resp = client.get("/notifications")
+    async def test_list_empty(self, client):
+        resp = await client.get("/notifications")
         assert resp.status_code == 200
         assert resp.json()["count"] == 0
 
-    def test_list_with_filters(self, client):
-        client.post("/notifications/push", json={
+    async def test_list_with_filters(self, client):
+        await client.post("/notifications/push", json={
             "level": "info", "source": "radar", "title": "R",
         })
-        client.post("/notifications/push", json={
+        await client.post("/notifications/push", json={
             "level": "error", "source": "lab", "title": "L",
         })
 
-        resp = client.get("/notifications?source=radar")
+        resp = await client.get("/notifications?source=radar")
         assert resp.json()["count"] == 1
         assert resp.json()["notifications"][0]["source"] == "radar"
 
-        resp = client.get("/notifications?level=error")
+        resp = await client.get("/notifications?level=error")
         assert resp.json()["count"] == 1
 
 
 class TestHTTPGet:
     """Tests for GET /notifications/{id}."""
 
-    def test_get_existing(self, client):
-        push_resp = client.post("/notifications/push", json={
+    async def test_get_existing(self, client):
+        push_resp = await client.post("/notifications/push", json={
             "level": "info", "source": "test", "title": "Test",
         })
         nid = push_resp.json()["id"]
 
-        resp = client.get(f"/notifications/{nid}")
+        resp = await client.get(f"/notifications/{nid}")
         assert resp.status_code == 200
         assert resp.json()["notification"]["title"] == "Test"
 
-    def test_get_not_found(self, client):
-        resp = client.get("/notifications/nonexistent")
+    async def test_get_not_found(self, client):
+        resp = await client.get("/notifications/nonexistent")
         assert resp.status_code == 404
 
 
 class TestHTTPMarkRead:
     """Tests for POST /notifications/read."""
 
-    def test_mark_read(self, client):
-        push_resp = client.post("/notifications/push", json={
+    async def test_mark_read(self, client):
+        push_resp = await client.post("/notifications/push", json={
             "level": "info", "source": "test", "title": "Test",
         })
         nid = push_resp.json()["id"]
 
-        resp = client.post("/notifications/read", json={"ids": [nid]})
+        resp = await client.post("/notifications/read", json={"ids": [nid]})
         assert resp.status_code == 200
         assert resp.json()["marked"] == 1
 
         # Verify it's now read
-        detail = client.get(f"/notifications/{nid}")
+        detail = await client.get(f"/notifications/{nid}")
         assert detail.json()["notification"]["read_at"] is not None
 
-    def test_mark_read_empty_ids(self, client):
-        resp = client.post("/notifications/read", json={"ids": []})
+    async def test_mark_read_empty_ids(self, client):
+        resp = await client.post("/notifications/read", json={"ids": []})
         assert resp.status_code == 400
 
 
 class TestHTTPSummary:
     """Tests for GET /notifications/summary."""
 
-    def test_summary(self, client):
-        client.post("/notifications/push", json={
+    async def test_summary(self, client):
+        await client.post("/notifications/push", json={
             "level": "info", "source": "radar", "title": "R",
         })
-        client.post("/notifications/push", json={
+        await client.post("/notifications/push", json={
             "level": "error", "source": "lab", "title": "L",
         })
 
-        resp = client.get("/notifications/summary")
+        resp = await client.get("/notifications/summary")
         assert resp.status_code == 200
         data = resp.json()
         assert data["total_unread"] == 2
@@ -376,39 +406,39 @@ class TestHTTPSummary:
 class TestHTTPEndToEnd:
     """Full round-trip through HTTP endpoints."""
 
-    def test_push_list_read_clear(self, client):
+    async def test_push_list_read_clear(self, client):
         # Push two notifications
-        r1 = client.post("/notifications/push", json={
+        r1 = (await client.post("/notifications/push", json={
             "level": "info", "source": "blah-radar",
             "title": "Report ready: 5 signals",
             "metadata": {"report_id": "rpt-001"},
-        }).json()
-        r2 = client.post("/notifications/push", json={
+        })).json()
+        r2 = (await client.post("/notifications/push", json={
             "level": "warning", "source": "blah-radar",
             "title": "Failed to poll source abc",
-        }).json()
+        })).json()
 
         # List all
-        all_notifs = client.get("/notifications").json()
+        all_notifs = (await client.get("/notifications")).json()
         assert all_notifs["count"] == 2
 
         # Summary shows 2 unread
-        summary = client.get("/notifications/summary").json()
+        summary = (await client.get("/notifications/summary")).json()
         assert summary["total_unread"] == 2
         assert summary["by_source"]["blah-radar"] == 2
 
         # Filter unread only
-        unread = client.get("/notifications?unread_only=true").json()
+        unread = (await client.get("/notifications?unread_only=true")).json()
         assert unread["count"] == 2
 
         # Mark one as read
-        client.post("/notifications/read", json={"ids": [r1["id"]]})
+        await client.post("/notifications/read", json={"ids": [r1["id"]]})
 
         # Summary now shows 1 unread
-        summary = client.get("/notifications/summary").json()
+        summary = (await client.get("/notifications/summary")).json()
         assert summary["total_unread"] == 1
 
         # Unread filter returns only the warning
-        unread = client.get("/notifications?unread_only=true").json()
+        unread = (await client.get("/notifications?unread_only=true")).json()
         assert unread["count"] == 1
         assert unread["notifications"][0]["level"] == "warning"
@@ -1,7 +1,7 @@
 """Integration tests for the MCP router."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, AsyncMock, MagicMock
 
 
 # Helper to call FastMCP tool functions
@@ -24,124 +24,103 @@ class TestHealthTool:
         assert 'email' in result['backends']
 
 
+def mock_journalctl(stdout: bytes = b'', stderr: bytes = b''):
+    """Patch asyncio.create_subprocess_exec with a fake journalctl process."""
+    proc = MagicMock()
+    proc.communicate = AsyncMock(return_value=(stdout, stderr))
+    return patch('asyncio.create_subprocess_exec', AsyncMock(return_value=proc))
+
+
 class TestLogsTool:
     """Tests for logs tool."""
 
-    def test_logs_default_service(self):
+    async def test_logs_default_service(self):
         """Should default to mcp-router service."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout='Jan 28 12:00:00 server log line',
-                stderr=''
-            )
-
+        with mock_journalctl(b'Jan 28 12:00:00 server log line') as mock_exec:
             from router.server import logs
-            result = call_tool(logs)
+            result = await call_tool(logs)
 
             assert result['service'] == 'mcp-router'
             assert result['lines'] == 50
-            mock_run.assert_called_once()
-            call_args = mock_run.call_args[0][0]
-            assert 'mcp-router@mark' in call_args
+            mock_exec.assert_called_once()
+            assert 'mcp-router@mark' in mock_exec.call_args[0]
 
-    def test_logs_custom_lines(self):
+    async def test_logs_custom_lines(self):
         """Should respect custom line count."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout='log output',
-                stderr=''
-            )
-
+        with mock_journalctl(b'log output') as mock_exec:
             from router.server import logs
-            result = call_tool(logs, lines=100)
+            result = await call_tool(logs, lines=100)
 
             assert result['lines'] == 100
-            call_args = mock_run.call_args[0][0]
-            assert '100' in call_args
+            assert '100' in mock_exec.call_args[0]
 
-    def test_logs_max_lines_capped(self):
+    async def test_logs_max_lines_capped(self):
         """Should cap lines at 500."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout='log output',
-                stderr=''
-            )
-
+        with mock_journalctl(b'log output'):
             from router.server import logs
-            result = call_tool(logs, lines=1000)
+            result = await call_tool(logs, lines=1000)
 
             assert result['lines'] == 500
 
-    def test_logs_min_lines_capped(self):
+    async def test_logs_min_lines_capped(self):
         """Should ensure at least 1 line."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout='log output',
-                stderr=''
-            )
-
+        with mock_journalctl(b'log output'):
             from router.server import logs
-            result = call_tool(logs, lines=-5)
+            result = await call_tool(logs, lines=-5)
 
             assert result['lines'] == 1
 
-    def test_logs_cloudflared_service(self):
+    async def test_logs_cloudflared_service(self):
         """Should support cloudflared service."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout='cloudflared log',
-                stderr=''
-            )
-
+        with mock_journalctl(b'cloudflared log') as mock_exec:
             from router.server import logs
-            result = call_tool(logs, service='cloudflared')
+            result = await call_tool(logs, service='cloudflared')
 
             assert result['service'] == 'cloudflared'
-            call_args = mock_run.call_args[0][0]
-            assert 'cloudflared' in call_args
+            assert 'cloudflared' in mock_exec.call_args[0]
 
-    def test_logs_invalid_service(self):
+    async def test_logs_invalid_service(self):
         """Should return error for unknown service."""
         from router.server import logs
-        result = call_tool(logs, service='unknown-service')
+        result = await call_tool(logs, service='unknown-service')
 
         assert 'error' in result
         assert 'Unknown service' in result['error']
 
-    def test_logs_includes_output(self):
+    async def test_logs_includes_output(self):
         """Should include journalctl output."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = MagicMock(
-                stdout='Jan 28 12:00:00 test log line\nJan 28 12:00:01 another line',
-                stderr=''
-            )
-
+        with mock_journalctl(b'Jan 28 12:00:00 test log line\nJan 28 12:00:01 another line'):
             from router.server import logs
-            result = call_tool(logs)
+            result = await call_tool(logs)
 
             assert 'logs' in result
             assert 'test log line' in result['logs']
 
-    def test_logs_timeout_handling(self):
-        """Should handle subprocess timeout."""
-        import subprocess
+    async def test_logs_output_capped(self):
+        """Should truncate oversized output to MAX_LOG_BYTES."""
+        from router.server import logs, MAX_LOG_BYTES
+
+        with mock_journalctl(b'x' * (MAX_LOG_BYTES + 1000)):
+            result = await call_tool(logs)
 
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = subprocess.TimeoutExpired(cmd='journalctl', timeout=10)
+            assert len(result['logs']) == MAX_LOG_BYTES
 
+    async def test_logs_timeout_handling(self):
+        """Should handle subprocess timeout."""
+        import asyncio
+
+        with patch('asyncio.create_subprocess_exec', AsyncMock(side_effect=asyncio.TimeoutError)):
             from router.server import logs
-            result = call_tool(logs)
+            result = await call_tool(logs)
 
             assert 'error' in result
             assert 'Timeout' in result['error']
 
-    def test_logs_exception_handling(self):
+    async def test_logs_exception_handling(self):
         """Should handle general exceptions."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = Exception('Some error')
-
+        with patch('asyncio.create_subprocess_exec', AsyncMock(side_effect=Exception('Some error'))):
             from router.server import logs
-            result = call_tool(logs)
+            result = await call_tool(logs)
 
             assert 'error' in result
 
@@ -1,12 +1,16 @@
 """Tests for the Todoist backend."""
 
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
+from types import MappingProxyType
+from unittest.mock import patch
 
 import httpx
 
+from router.backends.todoist import tasks, projects
 
-# Mock API responses
+
+# Mock API responses — frozen (tuples of read-only mappings) so the shared
+# response singletons below can't be mutated by a stray test
 MOCK_TASKS = [
     {
         'id': '123',
@@ -39,18 +43,30 @@ MOCK_TASKS = [
         'due': {'date': '2026-02-02', 'string': 'tomorrow'},
     },
 ]
+MOCK_TASKS = tuple(MappingProxyType(t) for t in MOCK_TASKS)
 
 MOCK_PROJECTS = [
     {'id': 'p1', 'name': 'Work', 'color': 'blue', 'is_favorite': True, 'view_style': 'list'},
     {'id': 'p2', 'name': 'Personal', 'color': 'green', 'is_favorite': False, 'view_style': 'board'},
     {'id': 'p3', 'name': 'Archive', 'color': 'grey', 'is_favorite': False, 'view_style': 'list'},
 ]
+MOCK_PROJECTS = tuple(MappingProxyType(p) for p in MOCK_PROJECTS)
 
 MOCK_SECTIONS = [
     {'id': 's1', 'name': 'To Do', 'project_id': 'p1', 'order': 1},
     {'id': 's2', 'name': 'In Progress', 'project_id': 'p1', 'order': 2},
     {'id': 's3', 'name': 'Done', 'project_id': 'p1', 'order': 3},
 ]
+MOCK_SECTIONS = tuple(MappingProxyType(s) for s in MOCK_SECTIONS)
+
+# Id-keyed views built once at import so single-item handlers are dict gets
+# instead of list scans
+MOCK_TASKS_BY_ID = {t['id']: t for t in MOCK_TASKS}
+MOCK_PROJECTS_BY_ID = {p['id']: p for p in MOCK_PROJECTS}
+SECTIONS_BY_PROJECT = {
+    pid: tuple(s for s in MOCK_SECTIONS if s['project_id'] == pid)
+    for pid in {s['project_id'] for s in MOCK_SECTIONS}
+}
 
 MOCK_COMMENT = {
     'id': 'c1',
@@ -59,9 +75,36 @@ MOCK_COMMENT = {
 }
 
 
+class FakeAsyncClient:
+    """Minimal stand-in for httpx.AsyncClient backed by a request handler.
+
+    A plain class with real async methods skips the MagicMock/AsyncMock proxy
+    machinery (per-attribute children, call recording) on every access.
+    """
+
+    __slots__ = ('_handler',)
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return None
+
+    async def request(self, method, url, **kwargs):
+        return await self._handler(method, url, **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self._handler('POST', url, **kwargs)
+
+
 class MockResponse:
     """Mock httpx response."""
 
+    __slots__ = ('status_code', '_json_data', 'text')
+
     def __init__(self, status_code: int, json_data=None, text: str = ''):
         self.status_code = status_code
         self._json_data = json_data
@@ -71,6 +114,17 @@ class MockResponse:
         return self._json_data
 
 
+# Constant responses shared across calls — the list payloads (and their
+# stringified text) are built once instead of per request
+TASKS_RESPONSE = MockResponse(200, {'results': MOCK_TASKS})
+PROJECTS_RESPONSE = MockResponse(200, {'results': MOCK_PROJECTS})
+SECTIONS_RESPONSE = MockResponse(200, {'results': MOCK_SECTIONS})
+NO_CONTENT = MockResponse(204)
+NOT_FOUND_TASK = MockResponse(404, text='Task not found')
+NOT_FOUND_PROJECT = MockResponse(404, text='Project not found')
+UNKNOWN_ENDPOINT = MockResponse(404, text='Unknown endpoint')
+
+
 async def call_tool(tool, **kwargs):
     """Call a FastMCP tool's underlying function."""
     return await tool.fn(**kwargs)
@@ -82,131 +136,151 @@ def todoist_env_vars(monkeypatch):
     monkeypatch.setenv('TODOIST_API_TOKEN', 'test-token-12345')
 
 
+@pytest.fixture(autouse=True)
+def reset_todoist_client():
+    """Drop the cached shared client so each test's httpx patch takes effect."""
+    from router.backends import todoist
+    todoist._client_instance = None
+    todoist._meta_cache.clear()
+    yield
+    todoist._client_instance = None
+    todoist._meta_cache.clear()
+
+
+# Sub-actions that POST /tasks/{id}/<action> acknowledges with 204
+_TASK_SUB_ACTIONS = {'close', 'reopen', 'move'}
+
+
+def _tasks_get(rest, kwargs):
+    if not rest:
+        return TASKS_RESPONSE
+    task = MOCK_TASKS_BY_ID.get(rest)
+    if task is not None:
+        return MockResponse(200, task)
+    return NOT_FOUND_TASK
+
+
+def _tasks_post(rest, kwargs):
+    if rest.rpartition('/')[2] in _TASK_SUB_ACTIONS:
+        return NO_CONTENT
+    # Create or update
+    json_body = kwargs.get('json', {})
+    new_task = {
+        'id': '999',
+        'content': json_body.get('content', 'New task'),
+        'description': json_body.get('description', ''),
+        'project_id': json_body.get('project_id', 'p1'),
+        'section_id': json_body.get('section_id'),
+        'priority': json_body.get('priority', 1),
+        'labels': json_body.get('labels', []),
+        'due': None,
+    }
+    if json_body.get('due_string'):
+        new_task['due'] = {'string': json_body['due_string']}
+    return MockResponse(200, new_task)
+
+
+def _projects_get(rest, kwargs):
+    if not rest:
+        return PROJECTS_RESPONSE
+    proj = MOCK_PROJECTS_BY_ID.get(rest)
+    if proj is not None:
+        return MockResponse(200, proj)
+    return NOT_FOUND_PROJECT
+
+
+def _projects_post(rest, kwargs):
+    json_body = kwargs.get('json', {})
+    new_proj = {
+        'id': 'p999',
+        'name': json_body.get('name', 'New Project'),
+        'color': json_body.get('color', 'blue'),
+        'is_favorite': json_body.get('is_favorite', False),
+        'view_style': json_body.get('view_style', 'list'),
+    }
+    return MockResponse(200, new_proj)
+
+
+def _sections_get(rest, kwargs):
+    project_id = kwargs.get('params', {}).get('project_id')
+    if project_id:
+        filtered = SECTIONS_BY_PROJECT.get(project_id, [])
+        return MockResponse(200, {'results': filtered})
+    return SECTIONS_RESPONSE
+
+
+def _sections_post(rest, kwargs):
+    json_body = kwargs.get('json', {})
+    new_section = {
+        'id': 's999',
+        'name': json_body.get('name', 'New Section'),
+        'project_id': json_body.get('project_id', 'p1'),
+        'order': json_body.get('order', 1),
+    }
+    return MockResponse(200, new_section)
+
+
+def _comments_post(rest, kwargs):
+    json_body = kwargs.get('json', {})
+    new_comment = {
+        'id': 'c999',
+        'task_id': json_body.get('task_id'),
+        'content': json_body.get('content'),
+    }
+    return MockResponse(200, new_comment)
+
+
+def _sync_post(rest, kwargs):
+    # Simulate premium required error
+    return MockResponse(200, {
+        'sync_status': {
+            kwargs.get('json', {}).get('commands', [{}])[0].get('uuid', ''): 'error',
+        },
+    })
+
+
+def _no_content(rest, kwargs):
+    return NO_CONTENT
+
+# O(1) dispatch on (method, resource) instead of substring scans per call
+_ROUTES = {
+    ('GET', 'tasks'): _tasks_get,
+    ('POST', 'tasks'): _tasks_post,
+    ('DELETE', 'tasks'): _no_content,
+    ('GET', 'projects'): _projects_get,
+    ('POST', 'projects'): _projects_post,
+    ('DELETE', 'projects'): _no_content,
+    ('GET', 'sections'): _sections_get,
+    ('POST', 'sections'): _sections_post,
+    ('DELETE', 'sections'): _no_content,
+    ('POST', 'comments'): _comments_post,
+    ('POST', 'sync'): _sync_post,
+}
+
+
+async def mock_request(method, url, **kwargs):
+    """Route mock requests based on URL and method."""
+    _, _, tail = url.partition('/api/v1/')
+    resource, _, rest = tail.partition('/')
+    handler = _ROUTES.get((method, resource))
+    if handler is None:
+        return UNKNOWN_ENDPOINT
+    return handler(rest, kwargs)
+
+
 def create_mock_todoist_api():
     """Create mock httpx.AsyncClient for Todoist API calls."""
-
-    async def mock_request(method, url, **kwargs):
-        """Route mock requests based on URL and method."""
-        # Tasks endpoints
-        if '/api/v1/tasks' in url:
-            if method == 'GET':
-                if url.endswith('/tasks'):
-                    return MockResponse(200, {'results': MOCK_TASKS})
-                # Get single task
-                task_id = url.split('/')[-1]
-                for task in MOCK_TASKS:
-                    if task['id'] == task_id:
-                        return MockResponse(200, task)
-                return MockResponse(404, text='Task not found')
-            elif method == 'POST':
-                if '/close' in url:
-                    return MockResponse(204)
-                if '/reopen' in url:
-                    return MockResponse(204)
-                if '/move' in url:
-                    return MockResponse(204)
-                # Create or update
-                json_body = kwargs.get('json', {})
-                new_task = {
-                    'id': '999',
-                    'content': json_body.get('content', 'New task'),
-                    'description': json_body.get('description', ''),
-                    'project_id': json_body.get('project_id', 'p1'),
-                    'section_id': json_body.get('section_id'),
-                    'priority': json_body.get('priority', 1),
-                    'labels': json_body.get('labels', []),
-                    'due': None,
-                }
-                if json_body.get('due_string'):
-                    new_task['due'] = {'string': json_body['due_string']}
-                return MockResponse(200, new_task)
-            elif method == 'DELETE':
-                return MockResponse(204)
-
-        # Projects endpoints
-        if '/api/v1/projects' in url:
-            if method == 'GET':
-                if url.endswith('/projects'):
-                    return MockResponse(200, {'results': MOCK_PROJECTS})
-                # Get single project
-                project_id = url.split('/')[-1]
-                for proj in MOCK_PROJECTS:
-                    if proj['id'] == project_id:
-                        return MockResponse(200, proj)
-                return MockResponse(404, text='Project not found')
-            elif method == 'POST':
-                json_body = kwargs.get('json', {})
-                new_proj = {
-                    'id': 'p999',
-                    'name': json_body.get('name', 'New Project'),
-                    'color': json_body.get('color', 'blue'),
-                    'is_favorite': json_body.get('is_favorite', False),
-                    'view_style': json_body.get('view_style', 'list'),
-                }
-                return MockResponse(200, new_proj)
-            elif method == 'DELETE':
-                return MockResponse(204)
-
-        # Sections endpoints
-        if '/api/v1/sections' in url:
-            if method == 'GET':
-                params = kwargs.get('params', {})
-                project_id = params.get('project_id')
-                if project_id:
-                    filtered = [s for s in MOCK_SECTIONS if s['project_id'] == project_id]
-                    return MockResponse(200, {'results': filtered})
-                return MockResponse(200, {'results': MOCK_SECTIONS})
-            elif method == 'POST':
-                json_body = kwargs.get('json', {})
-                new_section = {
-                    'id': 's999',
-                    'name': json_body.get('name', 'New Section'),
-                    'project_id': json_body.get('project_id', 'p1'),
-                    'order': json_body.get('order', 1),
-                }
-                return MockResponse(200, new_section)
-            elif method == 'DELETE':
-                return MockResponse(204)
-
-        # Comments endpoint
-        if '/api/v1/comments' in url:
-            if method == 'POST':
-                json_body = kwargs.get('json', {})
-                new_comment = {
-                    'id': 'c999',
-                    'task_id': json_body.get('task_id'),
-                    'content': json_body.get('content'),
-                }
-                return MockResponse(200, new_comment)
-
-        # Sync API (for reminders)
-        if '/api/v1/sync' in url:
-            # Simulate premium required error
-            return MockResponse(200, {
-                'sync_status': {
-                    kwargs.get('json', {}).get('commands', [{}])[0].get('uuid', ''): 'error',
-                },
-            })
-
-        return MockResponse(404, text='Unknown endpoint')
-
-    # Create mock for post that properly awaits
-    async def mock_post(url, **kw):
-        return await mock_request('POST', url, **kw)
-
-    # Create the mock client context manager
-    mock_client = MagicMock()
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
-    mock_client.request = AsyncMock(side_effect=mock_request)
-    mock_client.post = AsyncMock(side_effect=mock_post)
-
-    return mock_client
+    return FakeAsyncClient(mock_request)
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def mock_todoist_api():
-    """Fixture that patches httpx for Todoist API."""
+    """Patch httpx for Todoist API once per module.
+
+    Building the mock client is the expensive part of setup and the
+    dispatcher is stateless, so one client serves every test; the autouse
+    reset_todoist_client fixture still clears backend-side caches per test.
+    """
     mock_client = create_mock_todoist_api()
     with patch('router.backends.todoist.httpx.AsyncClient', return_value=mock_client):
         yield mock_client
@@ -217,8 +291,6 @@ class TestTasksTool:
 
     async def test_tasks_list_returns_tasks_with_metadata(self, mock_todoist_api, todoist_env_vars):
         """List should return tasks with deduped projects/sections metadata."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='list')
 
         assert 'tasks' in result
@@ -238,8 +310,6 @@ class TestTasksTool:
 
     async def test_tasks_list_with_filter(self, mock_todoist_api, todoist_env_vars):
         """List with filter should pass filter param to API."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='list', filter='today')
 
         assert 'tasks' in result
@@ -247,46 +317,33 @@ class TestTasksTool:
 
     async def test_tasks_list_with_project_filter(self, mock_todoist_api, todoist_env_vars):
         """List with project_id should filter by project."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='list', project_id='p1')
 
         assert 'tasks' in result
         assert 'error' not in result
 
-    async def test_tasks_create_basic(self, mock_todoist_api, todoist_env_vars):
-        """Create should create a task and return it."""
-        from router.backends.todoist import tasks
-
-        result = await call_tool(tasks, action='create', content='New test task')
-
-        assert 'task' in result
-        assert result['task']['content'] == 'New test task'
-        assert 'error' not in result
-
-    async def test_tasks_create_with_all_fields(self, mock_todoist_api, todoist_env_vars):
-        """Create with all fields should include them in request."""
-        from router.backends.todoist import tasks
-
-        result = await call_tool(
-            tasks,
-            action='create',
-            content='Full task',
-            description='A description',
-            project_id='p1',
-            section_id='s1',
-            priority=4,
-            due_string='tomorrow 3pm',
-            labels=['urgent', 'work'],
-        )
+    @pytest.mark.parametrize('kwargs', [
+        {'content': 'New test task'},
+        {
+            'content': 'Full task',
+            'description': 'A description',
+            'project_id': 'p1',
+            'section_id': 's1',
+            'priority': 4,
+            'due_string': 'tomorrow 3pm',
+            'labels': ['urgent', 'work'],
+        },
+    ], ids=['basic', 'all_fields'])
+    async def test_tasks_create(self, mock_todoist_api, todoist_env_vars, kwargs):
+        """Create should create a task echoing the given fields."""
+        result = await call_tool(tasks, action='create', **kwargs)
 
         assert 'task' in result
+        assert result['task']['content'] == kwargs['content']
         assert 'error' not in result
 
     async def test_tasks_create_with_comment(self, mock_todoist_api, todoist_env_vars):
         """Create with comment should create task and add comment."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(
             tasks,
             action='create',
@@ -301,8 +358,6 @@ class TestTasksTool:
 
     async def test_tasks_create_with_reminder_free_tier(self, mock_todoist_api, todoist_env_vars):
         """Create with reminder on free tier should return warning."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(
             tasks,
             action='create',
@@ -317,8 +372,6 @@ class TestTasksTool:
 
     async def test_tasks_create_missing_content_error(self, mock_todoist_api, todoist_env_vars):
         """Create without content should return error."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='create')
 
         assert 'error' in result
@@ -326,8 +379,6 @@ class TestTasksTool:
 
     async def test_tasks_get_single(self, mock_todoist_api, todoist_env_vars):
         """Get should fetch a single task by ID."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='get', task_id='123')
 
         assert 'task' in result
@@ -336,8 +387,6 @@ class TestTasksTool:
 
     async def test_tasks_update_content(self, mock_todoist_api, todoist_env_vars):
         """Update should modify task fields."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(
             tasks,
             action='update',
@@ -350,8 +399,6 @@ class TestTasksTool:
 
     async def test_tasks_update_with_comment(self, mock_todoist_api, todoist_env_vars):
         """Update with comment should update task and add comment."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(
             tasks,
             action='update',
@@ -365,8 +412,6 @@ class TestTasksTool:
 
     async def test_tasks_update_comment_only(self, mock_todoist_api, todoist_env_vars):
         """Update with only comment should add comment to existing task."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(
             tasks,
             action='update',
@@ -379,16 +424,12 @@ class TestTasksTool:
 
     async def test_tasks_update_no_fields_error(self, mock_todoist_api, todoist_env_vars):
         """Update with no fields should return error."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='update', task_id='123')
 
         assert 'error' in result
 
     async def test_tasks_complete(self, mock_todoist_api, todoist_env_vars):
         """Complete should close the task."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='complete', task_id='123')
 
         assert result['success'] is True
@@ -396,8 +437,6 @@ class TestTasksTool:
 
     async def test_tasks_reopen(self, mock_todoist_api, todoist_env_vars):
         """Reopen should reopen a completed task."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='reopen', task_id='123')
 
         assert result['success'] is True
@@ -405,26 +444,20 @@ class TestTasksTool:
 
     async def test_tasks_delete(self, mock_todoist_api, todoist_env_vars):
         """Delete should remove the task."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='delete', task_id='123')
 
         assert result['success'] is True
         assert result['task_id'] == '123'
 
-    async def test_tasks_missing_task_id_error(self, mock_todoist_api, todoist_env_vars):
+    @pytest.mark.parametrize('action', ['get', 'update', 'delete', 'complete', 'reopen'])
+    async def test_tasks_missing_task_id_error(self, mock_todoist_api, todoist_env_vars, action):
         """Actions requiring task_id should return error if missing."""
-        from router.backends.todoist import tasks
-
-        for action in ['get', 'update', 'delete', 'complete', 'reopen']:
-            result = await call_tool(tasks, action=action)
-            assert 'error' in result
-            assert 'task_id' in result['error'].lower()
+        result = await call_tool(tasks, action=action)
+        assert 'error' in result
+        assert 'task_id' in result['error'].lower()
 
     async def test_tasks_invalid_action_error(self, mock_todoist_api, todoist_env_vars):
         """Invalid action should return error."""
-        from router.backends.todoist import tasks
-
         result = await call_tool(tasks, action='invalid_action')
 
         assert 'error' in result
@@ -436,8 +469,6 @@ class TestProjectsTool:
 
     async def test_projects_list(self, mock_todoist_api, todoist_env_vars):
         """List should return all projects."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='list')
 
         assert 'projects' in result
@@ -447,8 +478,6 @@ class TestProjectsTool:
 
     async def test_projects_get_includes_sections(self, mock_todoist_api, todoist_env_vars):
         """Get should return project with its sections."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='get', project_id='p1')
 
         assert 'project' in result
@@ -458,35 +487,20 @@ class TestProjectsTool:
         # Should have sections for this project
         assert len(result['sections']) > 0
 
-    async def test_projects_create(self, mock_todoist_api, todoist_env_vars):
-        """Create should create a new project."""
-        from router.backends.todoist import projects
-
-        result = await call_tool(projects, action='create', name='New Project')
-
-        assert 'project' in result
-        assert result['project']['name'] == 'New Project'
-
-    async def test_projects_create_with_all_fields(self, mock_todoist_api, todoist_env_vars):
-        """Create with all fields should include them."""
-        from router.backends.todoist import projects
-
-        result = await call_tool(
-            projects,
-            action='create',
-            name='Full Project',
-            color='red',
-            is_favorite=True,
-            view_style='board',
-        )
+    @pytest.mark.parametrize('kwargs', [
+        {'name': 'New Project'},
+        {'name': 'Full Project', 'color': 'red', 'is_favorite': True, 'view_style': 'board'},
+    ], ids=['basic', 'all_fields'])
+    async def test_projects_create(self, mock_todoist_api, todoist_env_vars, kwargs):
+        """Create should create a new project echoing the given fields."""
+        result = await call_tool(projects, action='create', **kwargs)
 
         assert 'project' in result
+        assert result['project']['name'] == kwargs['name']
         assert 'error' not in result
 
     async def test_projects_create_missing_name_error(self, mock_todoist_api, todoist_env_vars):
         """Create without name should return error."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='create')
 
         assert 'error' in result
@@ -494,8 +508,6 @@ class TestProjectsTool:
 
     async def test_projects_update(self, mock_todoist_api, todoist_env_vars):
         """Update should modify project fields."""
-        from router.backends.todoist import projects
-
         result = await call_tool(
             projects,
             action='update',
@@ -508,16 +520,12 @@ class TestProjectsTool:
 
     async def test_projects_update_no_fields_error(self, mock_todoist_api, todoist_env_vars):
         """Update with no fields should return error."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='update', project_id='p1')
 
         assert 'error' in result
 
     async def test_projects_delete(self, mock_todoist_api, todoist_env_vars):
         """Delete should remove the project."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='delete', project_id='p1')
 
         assert result['success'] is True
@@ -525,8 +533,6 @@ class TestProjectsTool:
 
     async def test_projects_list_sections(self, mock_todoist_api, todoist_env_vars):
         """List sections should return sections for a project."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='list_sections', project_id='p1')
 
         assert 'sections' in result
@@ -535,8 +541,6 @@ class TestProjectsTool:
 
     async def test_projects_add_section(self, mock_todoist_api, todoist_env_vars):
         """Add section should create a new section."""
-        from router.backends.todoist import projects
-
         result = await call_tool(
             projects,
             action='add_section',
@@ -549,8 +553,6 @@ class TestProjectsTool:
 
     async def test_projects_add_section_with_order(self, mock_todoist_api, todoist_env_vars):
         """Add section with order should include it."""
-        from router.backends.todoist import projects
-
         result = await call_tool(
             projects,
             action='add_section',
@@ -564,8 +566,6 @@ class TestProjectsTool:
 
     async def test_projects_add_section_missing_name_error(self, mock_todoist_api, todoist_env_vars):
         """Add section without name should return error."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='add_section', project_id='p1')
 
         assert 'error' in result
@@ -573,26 +573,20 @@ class TestProjectsTool:
 
     async def test_projects_delete_section(self, mock_todoist_api, todoist_env_vars):
         """Delete section should remove the section."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='delete_section', section_id='s1')
 
         assert result['success'] is True
         assert result['section_id'] == 's1'
 
-    async def test_projects_missing_project_id_error(self, mock_todoist_api, todoist_env_vars):
+    @pytest.mark.parametrize('action', ['get', 'update', 'delete', 'list_sections', 'add_section'])
+    async def test_projects_missing_project_id_error(self, mock_todoist_api, todoist_env_vars, action):
         """Actions requiring project_id should return error if missing."""
-        from router.backends.todoist import projects
-
-        for action in ['get', 'update', 'delete', 'list_sections', 'add_section']:
-            result = await call_tool(projects, action=action)
-            assert 'error' in result
-            assert 'project_id' in result['error'].lower()
+        result = await call_tool(projects, action=action)
+        assert 'error' in result
+        assert 'project_id' in result['error'].lower()
 
     async def test_projects_missing_section_id_error(self, mock_todoist_api, todoist_env_vars):
         """Delete section without section_id should return error."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='delete_section')
 
         assert 'error' in result
@@ -600,61 +594,36 @@ class TestProjectsTool:
 
     async def test_projects_invalid_action_error(self, mock_todoist_api, todoist_env_vars):
         """Invalid action should return error."""
-        from router.backends.todoist import projects
-
         result = await call_tool(projects, action='invalid_action')
 
         assert 'error' in result
         assert 'invalid' in result['error'].lower()
 
 
-class TestAPIErrorHandling:
-    """Tests for API error handling."""
-
-    async def test_api_error_returns_error_dict(self, todoist_env_vars):
-        """API errors should return error dict."""
-        from router.backends.todoist import tasks
+def _failing_client(failure):
+    """Build a fake client whose requests raise or return the given failure."""
+    async def failing_request(*args, **kwargs):
+        if isinstance(failure, Exception):
+            raise failure
+        return failure
 
-        async def mock_request_error(*args, **kwargs):
-            return MockResponse(401, text='Unauthorized')
+    return FakeAsyncClient(failing_request)
 
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.request = AsyncMock(side_effect=mock_request_error)
-
-        with patch('router.backends.todoist.httpx.AsyncClient', return_value=mock_client):
-            result = await call_tool(tasks, action='list')
 
-        assert 'error' in result
-        assert '401' in result['error']
-
-    async def test_api_timeout_returns_error_dict(self, todoist_env_vars):
-        """Timeout should return error dict."""
-        from router.backends.todoist import tasks
-
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.request = AsyncMock(side_effect=httpx.TimeoutException('Timeout'))
-
-        with patch('router.backends.todoist.httpx.AsyncClient', return_value=mock_client):
-            result = await call_tool(tasks, action='list')
-
-        assert 'error' in result
-        assert 'timed out' in result['error'].lower()
-
-    async def test_api_exception_returns_error_dict(self, todoist_env_vars):
-        """General exception should return error dict."""
-        from router.backends.todoist import tasks
+class TestAPIErrorHandling:
+    """Tests for API error handling."""
 
-        mock_client = MagicMock()
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-        mock_client.request = AsyncMock(side_effect=Exception('Connection failed'))
+    @pytest.mark.parametrize('failure, expect', [
+        (MockResponse(401, text='Unauthorized'), '401'),
+        (httpx.TimeoutException('Timeout'), 'timed out'),
+        (Exception('Connection failed'), 'connection failed'),
+    ])
+    async def test_api_failure_returns_error_dict(self, todoist_env_vars, failure, expect):
+        """HTTP errors, timeouts, and general exceptions all surface as error dicts."""
+        mock_client = _failing_client(failure)
 
         with patch('router.backends.todoist.httpx.AsyncClient', return_value=mock_client):
             result = await call_tool(tasks, action='list')
 
         assert 'error' in result
-        assert 'Connection failed' in result['error']
+        assert expect in result['error'].lower()